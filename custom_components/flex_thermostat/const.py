@@ -1,67 +1,66 @@
 """Flex Thermostat Constants."""
 from logging import Logger, getLogger
-from homeassistant.backports.enum import StrEnum
+from typing import Final
 
 _LOGGER: Logger = getLogger(__package__)
 
 # Basic Config
-CONF_NAME = "name"
-CONF_TEMP_SENSOR = "temp_sensor"
-CONF_HEATER_SWITCH = "heater_switch"
-CONF_COOLER_SWITCH = "cooler_switch"
-CONF_FAN_SWITCH = "fan_switch"
+CONF_NAME: Final = "name"
+CONF_TEMP_SENSOR: Final = "temp_sensor"
+CONF_HEATER_SWITCH: Final = "heater_switch"
+CONF_COOLER_SWITCH: Final = "cooler_switch"
+CONF_FAN_SWITCH: Final = "fan_switch"
 
 # General Thermostat Settings
-CONF_TEMP_MIN = "temp_min"
-CONF_TEMP_MAX = "temp_max"
-CONF_TEMP_STEP = "temp_step"
-CONF_TEMP_TOLERANCE = "temp_tolerance"
-CONF_CLIMATE_CYCLE_RUNTIME = "climate_cycle_runtime"
-CONF_CLIMATE_CYCLE_COOLDOWN = "climate_cycle_cooldown"
+CONF_TEMP_MIN: Final = "temp_min"
+CONF_TEMP_MAX: Final = "temp_max"
+CONF_TEMP_STEP: Final = "temp_step"
+CONF_TEMP_TOLERANCE: Final = "temp_tolerance"
+CONF_CLIMATE_CYCLE_RUNTIME: Final = "climate_cycle_runtime"
+CONF_CLIMATE_CYCLE_COOLDOWN: Final = "climate_cycle_cooldown"
 
 # Preset/ and Climate Settings
-CONF_PRESETS = "presets"
-CONF_PRESET_NAME = "name"
-CONF_CLIMATE_TARGET_TEMP = "target_temp"
-CONF_CLIMATE_TARGET_TEMP_LOW = "target_temp_low"
-CONF_CLIMATE_TARGET_TEMP_HIGH = "target_temp_high"
-CONF_CLIMATE_FAN_MODE = "fan_mode"
-CONF_CLIMATE_HVAC_MODE = "hvac_mode"
+CONF_PRESETS: Final = "presets"
+CONF_PRESET_NAME: Final = "name"
+CONF_CLIMATE_TARGET_TEMP: Final = "target_temp"
+CONF_CLIMATE_TARGET_TEMP_LOW: Final = "target_temp_low"
+CONF_CLIMATE_TARGET_TEMP_HIGH: Final = "target_temp_high"
+CONF_CLIMATE_FAN_MODE: Final = "fan_mode"
+CONF_CLIMATE_HVAC_MODE: Final = "hvac_mode"
 
 # Opening Settings
-CONF_OPENINGS = "openings"
-CONF_OPENING_ENTITY = "opening"
-CONF_OPENING_DELAY = "delay"
-CONF_DEFAULT_OPENING_DELAY = "default_opening_delay"
+CONF_OPENINGS: Final = "openings"
+CONF_OPENING_ENTITY: Final = "opening"
+CONF_OPENING_DELAY: Final = "delay"
 
 # Configurable Defaults
-CONF_DEFAULT_OPENING_DELAY = "default_opening_delay"
-CONF_DEFAULT_PRESET_HVAC_MODE = "default_preset_hvac_mode"
-CONF_DEFAULT_PRESET_FAN_MODE = "default_preset_fan_mode"
+CONF_DEFAULT_OPENING_DELAY: Final = "default_opening_delay"
+CONF_DEFAULT_PRESET_HVAC_MODE: Final = "default_preset_hvac_mode"
+CONF_DEFAULT_PRESET_FAN_MODE: Final = "default_preset_fan_mode"
 
 # Initial Settings
-CONF_INITIAL_PRESET = "initial_preset"
-CONF_INITIAL_SETTINGS = "initial_settings"
+CONF_INITIAL_PRESET: Final = "initial_preset"
+CONF_INITIAL_SETTINGS: Final = "initial_settings"
 
 # State Attribute names
-ATTR_MANUAL_FAN_MODE = "manual_fan_mode"
-ATTR_MANUAL_HVAC_MODE = "manual_hvac_mode"
-ATTR_MANUAL_TEMP_LOW = "manual_temp_low"
-ATTR_MANUAL_TEMP_HIGH = "manual_temp_high"
-ATTR_LAST_CYCLE = "last_cycle"
+ATTR_MANUAL_TEMP_LOW: Final = "manual_temp_low"
+ATTR_MANUAL_TEMP_HIGH: Final = "manual_temp_high"
+ATTR_LAST_CYCLE: Final = "last_cycle"
 
-ATTR_CLIMATE_CYCLE_LAST_STOP = "climate_cycle_last_stop"
-ATTR_CLIMATE_CYCLE_LAST_START = "climate_cycle_last_start"
-ATTR_MANUAL_FAN_MODE = "fan_mode"
-ATTR_MANUAL_HVAC_MODE = "hvac_mode"
-ATTR_MANUAL_TARGET_TEMPERATURE = "target_temperature"
-ATTR_MANUAL_TARGET_TEMPERATURE_LOW = "target_temperature_low"
-ATTR_MANUAL_TARGET_TEMPERATURE_HIGH = "target_temperature_high"
+ATTR_CLIMATE_CYCLE_LAST_STOP: Final = "climate_cycle_last_stop"
+ATTR_CLIMATE_CYCLE_LAST_START: Final = "climate_cycle_last_start"
 
+# Manual climate settings, these keys are persisted in the restored state so they must not change
+ATTR_MANUAL_FAN_MODE: Final = "fan_mode"
+ATTR_MANUAL_HVAC_MODE: Final = "hvac_mode"
+ATTR_MANUAL_TARGET_TEMPERATURE: Final = "target_temperature"
+ATTR_MANUAL_TARGET_TEMPERATURE_LOW: Final = "target_temperature_low"
+ATTR_MANUAL_TARGET_TEMPERATURE_HIGH: Final = "target_temperature_high"
 
-class FanAction(StrEnum):
+
+class FanAction:
     """Fan Actions for Climate Devices."""
 
-    OFF = "off"
-    ON = "on"
-    IDLE = "idle"
+    OFF: Final[str] = "off"
+    ON: Final[str] = "on"
+    IDLE: Final[str] = "idle"
@@ -1,24 +1,62 @@
 """The Cycle Manager class."""
 
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+import time
 
 
-class CycleManager:
-    """Manager for tracking on/off cycles."""
+class CycleStatus(NamedTuple):
+    """Snapshot of the cycle state taken at a single point in time."""
+
+    can_start: bool
+    can_stop: bool
+    remaining_start_time: timedelta | None
+    remaining_stop_time: timedelta | None
+
 
-    _min_runtime: timedelta | None
-    _min_cooldown: timedelta | None
-    _last_start: datetime | None = None
-    _last_stop: datetime | None = None
-    _is_initialized: bool = False
+class CycleManager:
+    """Manager for tracking on/off cycles.
+
+    The last start/stop times are kept as UTC datetimes so they can be persisted, the
+    start/stop checks use monotonic deadlines so wall clock changes can't cause spurious cycles.
+    """
+
+    __slots__ = (
+        "_min_runtime_seconds",
+        "_min_cooldown_seconds",
+        "_last_start",
+        "_last_stop",
+        "_last_start_iso",
+        "_last_stop_iso",
+        "_start_deadline",
+        "_stop_deadline",
+        "_is_initialized",
+    )
+
+    _min_runtime_seconds: float | None
+    _min_cooldown_seconds: float | None
+    _last_start: datetime | None
+    _last_stop: datetime | None
+    _last_start_iso: str | None
+    _last_stop_iso: str | None
+    _start_deadline: float | None
+    _stop_deadline: float | None
+    _is_initialized: bool
 
     def __init__(
         self, min_runtime: timedelta | None, min_cooldown: timedelta | None
     ) -> None:
         """Initialize a new instance of the CycleManager class."""
 
-        self._min_runtime = min_runtime
-        self._min_cooldown = min_cooldown
+        self._min_runtime_seconds = min_runtime.total_seconds() if min_runtime is not None else None
+        self._min_cooldown_seconds = min_cooldown.total_seconds() if min_cooldown is not None else None
+        self._last_start = None
+        self._last_stop = None
+        self._last_start_iso = None
+        self._last_stop_iso = None
+        self._start_deadline = None
+        self._stop_deadline = None
+        self._is_initialized = False
 
     def initialize(
         self, last_start: datetime | None, last_stop: datetime | None
@@ -26,6 +64,14 @@ class CycleManager:
         """Prepare the manager for usage."""
         self._last_start = last_start
         self._last_stop = last_stop
+        self._last_start_iso = last_start.isoformat() if last_start is not None else None
+        self._last_stop_iso = last_stop.isoformat() if last_stop is not None else None
+
+        # Translate the restored timestamps onto the monotonic clock
+        now = datetime.now(timezone.utc)
+        monotonic_now = time.monotonic()
+        self._start_deadline = self._get_deadline(last_stop, self._min_cooldown_seconds, now, monotonic_now)
+        self._stop_deadline = self._get_deadline(last_start, self._min_runtime_seconds, now, monotonic_now)
         self._is_initialized = True
 
     @property
@@ -38,60 +84,76 @@ class CycleManager:
         """Get the timestamp of the last cycle start."""
         return self._last_start
 
+    @property
+    def last_stop_iso(self) -> str | None:
+        """Get the ISO formatted timestamp of the last cycle stop."""
+        return self._last_stop_iso
+
+    @property
+    def last_start_iso(self) -> str | None:
+        """Get the ISO formatted timestamp of the last cycle start."""
+        return self._last_start_iso
+
     @property
     def can_start(self) -> bool:
         """Returns a flag indicating if a cycle can start."""
-        if self._is_initialized is False:
-            raise RuntimeError("Manager has not been initialized")
-
-        return (
-            self._last_stop is None
-            or self._min_cooldown is None
-            or self._last_stop + self._min_cooldown <= datetime.now(timezone.utc)
-        )
+        return self.status().can_start
 
     @property
     def can_stop(self) -> bool:
         """Returns a flag indicating if a cycle can stop."""
-        if self._is_initialized is False:
-            raise RuntimeError("Manager has not been initialized")
-
-        return (
-            self._last_start is None
-            or self._min_runtime is None
-            or self._last_start + self._min_runtime <= datetime.now(timezone.utc)
-        )
+        return self.status().can_stop
 
     @property
-    def remaining_start_time(self) -> timedelta:
-        """Returns the timedelta for when the next cycle can start."""
-
-        if self._is_initialized is False:
-            raise RuntimeError("Manager has not been initialized")
-        elif self._last_stop is None:
-            raise RuntimeError("Can't get a remaining time if a cycle hasn't started")
-        elif self._min_cooldown is None:
-            raise RuntimeError("Can't get a remaining time without a minimum cooldown")
-
-        return (self._last_stop + self._min_cooldown) - datetime.now(timezone.utc)
+    def remaining_start_time(self) -> timedelta | None:
+        """Returns the timedelta for when the next cycle can start, None if there is no cooldown to wait for."""
+        return self.status().remaining_start_time
 
     @property
-    def remaining_stop_time(self) -> timedelta:
-        """Returns the timedelta for when the next cycle can stop."""
+    def remaining_stop_time(self) -> timedelta | None:
+        """Returns the timedelta for when the next cycle can stop, None if there is no runtime to wait for."""
+        return self.status().remaining_stop_time
+
+    def status(self, now: float | None = None) -> CycleStatus:
+        """Get the start/stop state of the cycle using a single `time.monotonic()` timestamp.
 
-        if self._is_initialized is False:
+        Remaining times are None when there is no deadline to wait for.
+        """
+        if not self._is_initialized:
             raise RuntimeError("Manager has not been initialized")
-        elif self._last_start is None:
-            raise RuntimeError("Can't get a remaining time if a cycle hasn't started")
-        elif self._min_runtime is None:
-            raise RuntimeError("Can't get a remaining time without a minimum runtime")
 
-        return (self._last_start + self._min_runtime) - datetime.now(timezone.utc)
+        if now is None:
+            now = time.monotonic()
+
+        return CycleStatus(
+            self._start_deadline is None or self._start_deadline <= now,
+            self._stop_deadline is None or self._stop_deadline <= now,
+            timedelta(seconds=self._start_deadline - now) if self._start_deadline is not None else None,
+            timedelta(seconds=self._stop_deadline - now) if self._stop_deadline is not None else None,
+        )
 
     def cycle_started(self) -> None:
         """Update the last started time to the current time."""
         self._last_start = datetime.now(timezone.utc)
+        self._last_start_iso = self._last_start.isoformat()
+
+        if self._min_runtime_seconds is not None:
+            self._stop_deadline = time.monotonic() + self._min_runtime_seconds
 
     def cycle_ended(self) -> None:
         """Update the last stopped time to the current time."""
         self._last_stop = datetime.now(timezone.utc)
+        self._last_stop_iso = self._last_stop.isoformat()
+
+        if self._min_cooldown_seconds is not None:
+            self._start_deadline = time.monotonic() + self._min_cooldown_seconds
+
+    @staticmethod
+    def _get_deadline(
+        timestamp: datetime | None, duration: float | None, now: datetime, monotonic_now: float
+    ) -> float | None:
+        """Get the monotonic time at which the duration after the timestamp has passed."""
+        if timestamp is None or duration is None:
+            return None
+
+        return monotonic_now - (now - timestamp).total_seconds() + duration
@@ -1,6 +1,8 @@
 """Thermostat implementation of the Flex Thermostat integration."""
 from __future__ import annotations
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable
+from typing import Any
+from datetime import datetime, timedelta
 import asyncio
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -9,6 +11,8 @@ from homeassistant.const import (
     UnitOfTemperature,
     EVENT_HOMEASSISTANT_START,
     ATTR_TEMPERATURE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import (
     State,
@@ -16,6 +20,7 @@ from homeassistant.core import (
     CoreState,
     callback,
     CALLBACK_TYPE,
+    HassJob,
 )
 from homeassistant.components.climate.const import (
     HVACMode,
@@ -27,13 +32,13 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.helpers.event import (
     async_track_state_change_event,
-    async_track_point_in_utc_time,
+    async_call_later,
 )
 
 from .switch_manager import SwitchManager
-from .cycle_manager import CycleManager
+from .cycle_manager import CycleManager, CycleStatus
 from .opening_manager import OpeningManager
-from .utilities import FanMode, ClimateSettings, UpdateResult
+from .utilities import FanMode, ClimateSettings, UpdateResult, EMPTY_RESULT, HANDLED_RESULT, DEFERRED_RESULT
 from .const import (
     _LOGGER,
     ATTR_CLIMATE_CYCLE_LAST_STOP,
@@ -49,6 +54,17 @@ from .const import (
 class FlexThermostat(ClimateEntity, RestoreEntity):
     """Flex Thermostat class that implements the core of the integration."""
 
+    _HEATING_HVAC_MODES: frozenset[HVACMode] = frozenset({HVACMode.HEAT, HVACMode.HEAT_COOL})
+    _COOLING_HVAC_MODES: frozenset[HVACMode] = frozenset({HVACMode.COOL, HVACMode.HEAT_COOL})
+
+    # Required fan states, actions take precedence over the fan mode and auto follows heating/cooling
+    _FAN_STATES_BY_ACTION: dict[HVACAction, bool] = {HVACAction.OFF: False, HVACAction.FAN: True}
+    _FAN_STATES_BY_MODE: dict[str, bool] = {FanMode.ON: True, FanMode.OFF: False}
+    _FAN_AUTO_ACTIONS: frozenset[HVACAction] = frozenset({HVACAction.HEATING, HVACAction.COOLING})
+
+    # Window used to coalesce bursts of temperature sensor updates into a single update
+    _TEMPERATURE_DEBOUNCE_SECONDS: float = 0.5
+
     # General Settings
     _name: str
     _temperature_sensor_id: str
@@ -58,16 +74,20 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
     _temperature_unit: UnitOfTemperature
     _temperature_step: float
     _presets: dict[str, ClimateSettings]
+    _preset_modes: list[str]
     _default_hvac_mode: HVACMode
-    _default_fan_mode: FanMode
+    _default_fan_mode: str
 
     # Current States
     _current_temperature: float | None = None
+    _last_temperature_state: str | None = None
     _current_settings: ClimateSettings
     _current_action: HVACAction
     _current_preset: str | None = None
     _previous_preset: str | None = None
     _previous_settings: ClimateSettings | None = None
+    _last_written_state: tuple | None = None
+    _cached_extra_state_attributes: dict[str, Any] | None = None
 
     # Internal objects
     _heater_switch: SwitchManager
@@ -75,11 +95,16 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
     _fan_switch: SwitchManager
     _climate_cycle_manager: CycleManager
     _opening_manager: OpeningManager
+    _hvac_action_resolvers: dict[HVACMode, Callable[[], HVACAction]]
+    _climate_transitions: dict[HVACAction, tuple[tuple[SwitchManager, ...], SwitchManager | None]]
+    _deferred_update_job: HassJob
     _remove_pending_defferal_listener: CALLBACK_TYPE | None = None
+    _remove_pending_debounce_listener: CALLBACK_TYPE | None = None
 
-    _base_supported_features: ClimateEntityFeature = ClimateEntityFeature(0)
-    _available_hvac_modes: list[HVACMode] = [HVACMode.OFF]
-    _available_fan_modes: list[FanMode] = []
+    _base_supported_features: ClimateEntityFeature
+    _cached_supported_features: ClimateEntityFeature
+    _available_hvac_modes: tuple[HVACMode, ...]
+    _available_fan_modes: tuple[str, ...]
     _is_initialized: bool = False
 
     def __init__(
@@ -99,7 +124,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         # Preset Settings
         presets: dict[str, ClimateSettings],
         default_preset_hvac_mode: HVACMode,
-        default_preset_fan_mode: FanMode,
+        default_preset_fan_mode: str,
         # General Settings
         temperature_min: float,
         temperature_max: float,
@@ -129,6 +154,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
 
         # Preset Settings
         self._presets = presets
+        self._preset_modes = list(presets.keys())
         self._default_hvac_mode = default_preset_hvac_mode
         self._default_fan_mode = default_preset_fan_mode
 
@@ -139,17 +165,44 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         self._fan_switch = SwitchManager(fan_switch_id)
         self._opening_manager = OpeningManager(opening_configs, default_opening_delay)
 
-        # Mode/Features setup
+        # Climate switches to stop and start for each action, any other action only stops the switches
+        self._climate_transitions = {
+            HVACAction.HEATING: ((self._cooler_switch,), self._heater_switch),
+            HVACAction.COOLING: ((self._heater_switch,), self._cooler_switch),
+            HVACAction.OFF: ((self._heater_switch, self._cooler_switch), None),
+            HVACAction.IDLE: ((self._heater_switch, self._cooler_switch), None),
+        }
+
+        # Job for deferred updates, built once so it can be reused for every deferral
+        self._deferred_update_job = HassJob(self._async_update, "flex_thermostat_deferred_update", cancel_on_shutdown=True)
+
+        # Action resolvers for each HVACMode, unknown modes resolve to idle
+        self._hvac_action_resolvers = {
+            HVACMode.OFF: self._resolve_off_action,
+            HVACMode.FAN_ONLY: self._resolve_fan_only_action,
+            HVACMode.HEAT: self._resolve_heat_action,
+            HVACMode.COOL: self._resolve_cool_action,
+            HVACMode.HEAT_COOL: self._resolve_heat_cool_action,
+        }
+
+        # Mode/Features setup, built per instance and stored as tuples so they can't be shared or mutated
+        hvac_modes = [HVACMode.OFF]
+        fan_modes = []
+        base_supported_features = ClimateEntityFeature(0)
         if fan_switch_id is not None:
-            self._available_hvac_modes.append(HVACMode.FAN_ONLY)
-            self._available_fan_modes = [FanMode.OFF, FanMode.ON, FanMode.AUTO]
-            self._base_supported_features |= ClimateEntityFeature.FAN_MODE
+            hvac_modes.append(HVACMode.FAN_ONLY)
+            fan_modes = [FanMode.OFF, FanMode.ON, FanMode.AUTO]
+            base_supported_features |= ClimateEntityFeature.FAN_MODE
         if heater_switch_id is not None:
-            self._available_hvac_modes.append(HVACMode.HEAT)
+            hvac_modes.append(HVACMode.HEAT)
         if cooler_switch_id is not None:
-            self._available_hvac_modes.append(HVACMode.COOL)
+            hvac_modes.append(HVACMode.COOL)
         if heater_switch_id is not None and cooler_switch_id is not None:
-            self._available_hvac_modes.append(HVACMode.HEAT_COOL)
+            hvac_modes.append(HVACMode.HEAT_COOL)
+
+        self._available_hvac_modes = tuple(hvac_modes)
+        self._available_fan_modes = tuple(fan_modes)
+        self._base_supported_features = base_supported_features
 
         # Set defaults
         if (len(self._presets) > 0) and initial_preset is not None:
@@ -158,6 +211,8 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         elif initial_settings is not None:
             self._current_settings = initial_settings
 
+        self._update_supported_features()
+
     # region Public Getters
 
     @property
@@ -178,7 +233,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
     @property
     def preset_modes(self) -> list[str] | None:
         """Return a list of available preset modes."""
-        return list(self._presets.keys())
+        return self._preset_modes
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -186,7 +241,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         return self._current_settings.hvac_mode
 
     @property
-    def hvac_modes(self) -> list[HVACMode]:
+    def hvac_modes(self) -> tuple[HVACMode, ...]:
         """Return the list of available hvac operation modes."""
         return self._available_hvac_modes
 
@@ -216,7 +271,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         return self._current_settings.fan_mode
 
     @property
-    def fan_modes(self) -> list[str] | None:
+    def fan_modes(self) -> tuple[str, ...] | None:
         """Return the list of available fan modes."""
         return self._available_fan_modes
 
@@ -248,23 +303,18 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
     @property
     def supported_features(self) -> ClimateEntityFeature:
         """Return the list of supported features."""
-        return (
-            self._base_supported_features | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            if self._is_dual_temperature_mode is True
-            else self._base_supported_features | ClimateEntityFeature.TARGET_TEMPERATURE
-        )
+        return self._cached_supported_features
 
     @property
     def extra_state_attributes(self):
         """Return entity specific state attributes to be saved."""
-        data: dict[str, any] = dict[str, any]()
+        if self._cached_extra_state_attributes is not None:
+            return self._cached_extra_state_attributes
 
-        data[ATTR_CLIMATE_CYCLE_LAST_STOP] = (
-            self._climate_cycle_manager.last_stop.isoformat() if self._climate_cycle_manager.last_stop is not None else None
-        )
-        data[ATTR_CLIMATE_CYCLE_LAST_START] = (
-            self._climate_cycle_manager.last_start.isoformat() if self._climate_cycle_manager.last_start is not None else None
-        )
+        data: dict[str, Any] = {}
+
+        data[ATTR_CLIMATE_CYCLE_LAST_STOP] = self._climate_cycle_manager.last_stop_iso
+        data[ATTR_CLIMATE_CYCLE_LAST_START] = self._climate_cycle_manager.last_start_iso
 
         # If the climate settings are manual store them
         if self._current_preset is None:
@@ -274,6 +324,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
             data[ATTR_MANUAL_TARGET_TEMPERATURE_LOW] = self._current_settings.target_temperature_low
             data[ATTR_MANUAL_TARGET_TEMPERATURE_HIGH] = self._current_settings.target_temperature_high
 
+        self._cached_extra_state_attributes = data
         return data
 
     # endregion
@@ -286,21 +337,22 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         target_temperature_low = kwargs.get(ATTR_TARGET_TEMP_LOW)
         target_temperature_high = kwargs.get(ATTR_TARGET_TEMP_HIGH)
 
-        if self._is_dual_temperature_mode is False and target_temperature is None:
+        if not self._is_dual_temperature_mode and target_temperature is None:
             raise ValueError("Target temperature required in current mode")
-        elif self._is_dual_temperature_mode is True and target_temperature_low is None and target_temperature_high is None:
+        elif self._is_dual_temperature_mode and target_temperature_low is None and target_temperature_high is None:
             raise ValueError("At least one temperature value is required")
 
+        self._cached_extra_state_attributes = None
         self._current_preset = None
-        self._current_settings.target_temperature = (
-            target_temperature if target_temperature is not None else self._current_settings.target_temperature
-        )
-        self._current_settings.target_temperature_low = (
-            target_temperature_low if target_temperature_low is not None else self._current_settings.target_temperature_low
-        )
-        self._current_settings.target_temperature_high = (
-            target_temperature_high if target_temperature_high is not None else self._current_settings.target_temperature_high
-        )
+
+        # Only overwrite the values that were provided
+        settings: ClimateSettings = self._current_settings
+        if target_temperature is not None:
+            settings.target_temperature = target_temperature
+        if target_temperature_low is not None:
+            settings.target_temperature_low = target_temperature_low
+        if target_temperature_high is not None:
+            settings.target_temperature_high = target_temperature_high
 
         _LOGGER.debug(
             "Temperate range changed to %s - %s",
@@ -308,7 +360,7 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
             target_temperature_high,
         )
 
-        if self._is_initialized is True:
+        if self._is_initialized:
             await self._async_update()
         else:
             _LOGGER.debug("Temperature target changed but integration hasn't been initialized")
@@ -317,10 +369,12 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         """Set new hvac mode."""
         _LOGGER.debug("Setting HVac Mode to %s", hvac_mode)
 
+        self._cached_extra_state_attributes = None
         self._current_preset = None
         self._current_settings.hvac_mode = hvac_mode
+        self._update_supported_features()
 
-        if self._is_initialized is True:
+        if self._is_initialized:
             await self._async_update()
         else:
             _LOGGER.debug("HVACMode changed but integration hasn't been initialized")
@@ -332,22 +386,25 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
 
         _LOGGER.debug("Changing preset to %s", preset_mode)
 
+        self._cached_extra_state_attributes = None
         self._current_preset = preset_mode
         self._current_settings = self._presets[preset_mode].clone()
+        self._update_supported_features()
 
-        if self._is_initialized is True:
+        if self._is_initialized:
             await self._async_update()
         else:
             _LOGGER.debug("Preset mode changed but integration hasn't been initialized")
 
-    async def async_set_fan_mode(self, fan_mode: str | FanMode) -> None:
+    async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the the new fan mode."""
         _LOGGER.debug("Changing Fan Mode to %s", fan_mode)
 
+        self._cached_extra_state_attributes = None
         self._current_preset = None
         self._current_settings.fan_mode = fan_mode
 
-        if self._is_initialized is True:
+        if self._is_initialized:
             await self._async_update()
         else:
             _LOGGER.debug("Preset mode changed but integration hasn't been initialized")
@@ -387,12 +444,15 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
                 self._current_settings = previous_settings
             # Otherwise something is weird or we have no state so use the default
 
+            self._cached_extra_state_attributes = None
+            self._update_supported_features()
+
         # Setup listeners
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
                 [self._temperature_sensor_id],
-                self._async_on_temperature_changed,
+                self._on_temperature_changed,
             )
         )
 
@@ -401,14 +461,14 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         # Startup function to run at HA startup or on creation, loads current values and old state
         @callback
         def _async_startup(*_) -> None:
-            sensor_state = self.hass.states.get(self._temperature_sensor_id)
-            self._current_temperature = float(sensor_state.state) if sensor_state is not None else None
+            self._read_temperature(self.hass.states.get(self._temperature_sensor_id))
 
             self._heater_switch.initialize(self.hass, self._on_switch_changed)
             self._cooler_switch.initialize(self.hass, self._on_switch_changed)
             self._fan_switch.initialize(self.hass, self._on_switch_changed)
-            self._opening_manager.initialize(self.hass, self._async_on_openings_state_changed)
+            self._opening_manager.initialize(self.hass, self._on_openings_state_changed)
             self._climate_cycle_manager.initialize(last_climate_cycle_start, last_climate_cycle_stop)
+            self._cached_extra_state_attributes = None
 
             self._is_initialized = True
 
@@ -421,22 +481,60 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
         else:
             self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _async_startup)
 
-    def _on_switch_changed(self, _: Event):
+    @callback
+    def _on_switch_changed(self, _: bool) -> None:
         self._defer_update(timedelta(seconds=30))
 
-    async def _async_on_openings_state_changed(self, _: bool) -> None:
-        await self._async_update()
+    @callback
+    def _on_openings_state_changed(self, _: bool) -> None:
+        self.hass.async_create_task(self._async_update())
 
-    async def _async_on_temperature_changed(self, event: Event):
+    @callback
+    def _on_temperature_changed(self, event: Event) -> None:
         _LOGGER.debug("Temperature sensor updated")
 
-        new_state = event.data.get("new_state")
-        self._current_temperature = float(new_state.state)
+        if not self._read_temperature(event.data.get("new_state")):
+            return
+        elif not self._is_initialized:
+            _LOGGER.debug("Temperature changed but integration hasn't been initialized")
+        elif self._get_hvac_action() != self._current_action:
+            # Restart the debounce window so a burst of readings only triggers one update
+            if self._remove_pending_debounce_listener is not None:
+                self._remove_pending_debounce_listener()
 
-        if self._is_initialized is True:
-            await self._async_update()
+            self._remove_pending_debounce_listener = async_call_later(
+                self.hass, self._TEMPERATURE_DEBOUNCE_SECONDS, self._async_debounced_update
+            )
         else:
-            _LOGGER.debug("Temperature changed but integration hasn't been initialized")
+            # Nothing to control, only the reported temperature has changed
+            self._write_state()
+
+    def _read_temperature(self, state: State | None) -> bool:
+        """Read the current temperature from the sensor state, returns True if a new value was read."""
+        if state is None or state.state == self._last_temperature_state:
+            return False
+
+        self._last_temperature_state = state.state
+
+        if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            _LOGGER.debug("Temperature sensor is %s, keeping the last temperature", state.state)
+            return False
+
+        try:
+            self._current_temperature = float(state.state)
+        except (ValueError, TypeError):
+            _LOGGER.warning("Unable to parse temperature sensor state %s", state.state)
+            return False
+
+        return True
+
+    def _update_supported_features(self) -> None:
+        """Recalculate the supported features, must be called whenever the HVACMode changes."""
+        self._cached_supported_features = (
+            self._base_supported_features | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+            if self._is_dual_temperature_mode
+            else self._base_supported_features | ClimateEntityFeature.TARGET_TEMPERATURE
+        )
 
     @property
     def _is_dual_temperature_mode(self) -> bool:
@@ -445,42 +543,49 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
 
     @property
     def _is_heating_required(self) -> bool:
-        # Determine what target should be used
-        target: float = (
-            self._current_settings.target_temperature_low
-            if self._is_dual_temperature_mode is True
-            else self._current_settings.target_temperature
-        )
+        settings: ClimateSettings = self._current_settings
+        hvac_mode: HVACMode = settings.hvac_mode
 
         return (
             # Check if the current mode supports heating (may not be needed?)
-            self._current_settings.hvac_mode in [HVACMode.HEAT, HVACMode.HEAT_COOL]
+            hvac_mode in self._HEATING_HVAC_MODES
             # Check that no openings are open
-            and self._opening_manager.is_any_opening_open is False
-            # Check if the temperature is below the target
-            and self._current_temperature - self._temperature_tolerance <= target
+            and not self._opening_manager.is_any_opening_open
+            # Check that a temperature has been read, the sensor may be unavailable
+            and self._current_temperature is not None
+            # Check if the temperature is below the target, using the low end of the range in dual mode
+            and self._current_temperature - self._temperature_tolerance
+            <= (settings.target_temperature_low if hvac_mode == HVACMode.HEAT_COOL else settings.target_temperature)
         )
 
     @property
     def _is_cooling_required(self) -> bool:
-        # Determine what target should be used
-        target: float = (
-            self._current_settings.target_temperature_high
-            if self._is_dual_temperature_mode is True
-            else self._current_settings.target_temperature
-        )
+        settings: ClimateSettings = self._current_settings
+        hvac_mode: HVACMode = settings.hvac_mode
 
         return (
-            # Check if the current mode supports heating (may not be needed?)
-            self._current_settings.hvac_mode in [HVACMode.COOL, HVACMode.HEAT_COOL]
+            # Check if the current mode supports cooling (may not be needed?)
+            hvac_mode in self._COOLING_HVAC_MODES
             # Check that no openings are open
-            and self._opening_manager.is_any_opening_open is False
-            # Check if the temperature is below the target
-            and self._current_temperature + self._temperature_tolerance >= target
+            and not self._opening_manager.is_any_opening_open
+            # Check that a temperature has been read, the sensor may be unavailable
+            and self._current_temperature is not None
+            # Check if the temperature is above the target, using the high end of the range in dual mode
+            and self._current_temperature + self._temperature_tolerance
+            >= (settings.target_temperature_high if hvac_mode == HVACMode.HEAT_COOL else settings.target_temperature)
         )
 
-    async def _async_update(self) -> None:
-        new_action: HVACAction = self._get_hvac_action(self._current_settings.hvac_mode)
+    async def _async_update(self, _: datetime | None = None) -> None:
+        # Any pending deferral (including the one that may have triggered this update) is superseded by this update,
+        # it will defer again if still needed
+        self._cancel_pending_deferral()
+
+        new_action: HVACAction = self._get_hvac_action()
+
+        # Skip the update entirely if there is nothing to do and nothing new to report
+        if new_action == self._current_action and self._get_unwritten_state_snapshot() is None:
+            _LOGGER.debug("Current action (%s) and state are unchanged, skipping update", self._current_action)
+            return
 
         # Determine what to do with the new action
         if new_action != self._current_action:
@@ -489,271 +594,227 @@ class FlexThermostat(ClimateEntity, RestoreEntity):
                 self._current_action,
                 new_action,
             )
-            result: UpdateResult = UpdateResult()
+            await self._async_apply_action(new_action)
+        else:
+            _LOGGER.debug(
+                "Current action and requested action are both (%s), taking no action.",
+                self._current_action,
+            )
 
-            # Handle the action for heating/cooling
-            if result.is_deferred is False:
-                result += await self._async_handle_action_climate(new_action)
+        self._write_state()
 
-            # Handle the action for the fan
-            if result.is_deferred is False:
-                result += await self._async_handle_action_fan(new_action)
+    def _get_state_snapshot(self) -> tuple:
+        """Get the values that make up the written state, used to detect when nothing has changed."""
+        settings: ClimateSettings = self._current_settings
+        cycle_manager: CycleManager = self._climate_cycle_manager
 
-            if result.is_handled is True and result.is_deferred is True:
-                raise RuntimeError("Action has both handled and deffered")
-            elif result.is_deferred is True and new_action == HVACAction.OFF:
-                raise RuntimeError("Off action cannot be deferred")
+        return (
+            self._current_action,
+            settings.hvac_mode,
+            settings.target_temperature,
+            settings.target_temperature_low,
+            settings.target_temperature_high,
+            settings.fan_mode,
+            self._current_temperature,
+            self._current_preset,
+            # Cycles can start/stop without the action changing, such as a stop followed by a deferred start
+            cycle_manager.last_start_iso,
+            cycle_manager.last_stop_iso,
+        )
 
-            _LOGGER.debug("Handle action result: Deferred = %s | Handled = %s", result.is_deferred, result.is_handled)
+    def _get_unwritten_state_snapshot(self) -> tuple | None:
+        """Get the state snapshot if it differs from the last written state, otherwise None."""
+        state_snapshot = self._get_state_snapshot()
+        return state_snapshot if state_snapshot != self._last_written_state else None
 
-            if result.is_handled is True or new_action == HVACAction.OFF:
-                self._current_action = new_action
+    @callback
+    def _write_state(self) -> None:
+        """Write the state to Home Assistant if it has changed since the last write."""
+        if not self._is_initialized:
+            _LOGGER.debug("State write requested but integration hasn't been initialized")
+            return
 
-        else:
-            _LOGGER.debug(
-                "Current action and requested action are both (%s), taking no action.",
-                self._current_action,
-            )
+        if (state_snapshot := self._get_unwritten_state_snapshot()) is None:
+            return
 
+        self._last_written_state = state_snapshot
         self.async_write_ha_state()
 
+    async def _async_apply_action(self, new_action: HVACAction) -> None:
+        """Update the switches for the given action and track it as the current action if it was handled."""
+        # Handle the action for heating/cooling
+        result: UpdateResult = await self._async_handle_action_climate(new_action)
+
+        # Handle the action for the fan
+        if not result.is_deferred:
+            result |= await self._async_handle_action_fan(new_action)
+
+        if result.is_handled and result.is_deferred:
+            raise RuntimeError("Action has both handled and deffered")
+        elif result.is_deferred and new_action == HVACAction.OFF:
+            raise RuntimeError("Off action cannot be deferred")
+
+        _LOGGER.debug("Handle action result: Deferred = %s | Handled = %s", result.is_deferred, result.is_handled)
+
+        if result.is_handled or new_action == HVACAction.OFF:
+            self._current_action = new_action
+
     def _get_hvac_action(self) -> HVACAction:
         """Determine what the HVAC action should be given the current mode."""
-        action: HVACAction
-        current_hvac_mode: HVACMode = self._current_settings.hvac_mode
-
-        if self._is_initialized is False:
+        if not self._is_initialized:
             raise RuntimeError("Determiner has not been initialized")
 
-        # NOTE: There is some redundant sections, this is done for readability
-        if current_hvac_mode == HVACMode.OFF:
-            action = HVACAction.OFF
-        # Fan only mode
-        elif current_hvac_mode == HVACMode.FAN_ONLY:
-            action = HVACAction.FAN
-        # Heating only mode
-        elif current_hvac_mode == HVACMode.HEAT:
-            if self._is_heating_required is True:
-                action = HVACAction.HEATING
-            else:
-                action = HVACAction.IDLE
-        # Cooling only mode
-        elif current_hvac_mode == HVACMode.COOL:
-            if self._is_cooling_required is True:
-                action = HVACAction.COOLING
-            else:
-                action = HVACAction.IDLE
-        # Dual Mode
-        elif current_hvac_mode == HVACMode.HEAT_COOL:
-            if self._is_heating_required is True:
-                action = HVACAction.HEATING
-            elif self._is_cooling_required is True:
-                action = HVACAction.COOLING
-            else:
-                action = HVACAction.IDLE
-        else:
-            action = HVACAction.IDLE
+        resolver = self._hvac_action_resolvers.get(self._current_settings.hvac_mode, self._resolve_idle_action)
+        return resolver()
 
-        return action
+    def _resolve_off_action(self) -> HVACAction:
+        return HVACAction.OFF
+
+    def _resolve_idle_action(self) -> HVACAction:
+        return HVACAction.IDLE
+
+    def _resolve_fan_only_action(self) -> HVACAction:
+        return HVACAction.FAN
+
+    def _resolve_heat_action(self) -> HVACAction:
+        return HVACAction.HEATING if self._is_heating_required else HVACAction.IDLE
+
+    def _resolve_cool_action(self) -> HVACAction:
+        return HVACAction.COOLING if self._is_cooling_required else HVACAction.IDLE
+
+    def _resolve_heat_cool_action(self) -> HVACAction:
+        if self._is_heating_required:
+            return HVACAction.HEATING
+        elif self._is_cooling_required:
+            return HVACAction.COOLING
+
+        return HVACAction.IDLE
 
     async def _async_handle_action_fan(self, requested_action: HVACAction) -> UpdateResult:
         # Currently fan control doesn't support deferral so the is_deferred flag should remain false
-        result: UpdateResult = UpdateResult()
-
-        if self._fan_switch.is_enabled is True:
-            if requested_action == HVACAction.OFF and self._fan_switch.is_active is True:
-                _LOGGER.debug("Fan is not needed, turning off %s", self._fan_switch.entity_id)
-                await self._fan_switch.async_turn_off()
-            elif requested_action == HVACAction.FAN:
-                if self._fan_switch.is_active is False:
-                    _LOGGER.debug("Fan is needed, turning on %s", self._fan_switch.entity_id)
-                    await self._fan_switch.async_turn_on()
-                result.is_handled = True
-            elif self._current_settings.fan_mode == FanMode.ON and self._fan_switch.is_active is False:
-                _LOGGER.debug("Fan is needed, turning on %s", self._fan_switch.entity_id)
-                await self._fan_switch.async_turn_on()
-            elif self._current_settings.fan_mode == FanMode.OFF and self._fan_switch.is_active is True:
-                _LOGGER.debug("Fan is not needed, turning off %s", self._fan_switch.entity_id)
-                await self._fan_switch.async_turn_off()
-            elif self._current_settings.fan_mode == FanMode.AUTO:
-                if requested_action == HVACAction.HEATING or requested_action == HVACAction.COOLING:
-                    if self._fan_switch.is_active is False:
-                        _LOGGER.debug("Fan is needed, turning on %s", self._fan_switch.entity_id)
-                        await self._fan_switch.async_turn_on()
-                else:
-                    if self._fan_switch.is_active is True:
-                        _LOGGER.debug(
-                            "Fan is not needed, turning off %s",
-                            self._fan_switch.entity_id,
-                        )
-                        await self._fan_switch.async_turn_off()
-
-        return result
+        fan_switch: SwitchManager = self._fan_switch
+
+        if not fan_switch.is_enabled:
+            return EMPTY_RESULT
+
+        fan_mode: str | None = self._current_settings.fan_mode
+
+        # The action decides the fan state for off/fan only, otherwise the fan mode does
+        is_fan_required: bool | None = self._FAN_STATES_BY_ACTION.get(requested_action)
+        if is_fan_required is None and fan_mode == FanMode.AUTO:
+            is_fan_required = requested_action in self._FAN_AUTO_ACTIONS
+        elif is_fan_required is None:
+            is_fan_required = self._FAN_STATES_BY_MODE.get(fan_mode)
+
+        if is_fan_required is True and not fan_switch.is_active:
+            _LOGGER.debug("Fan is needed, turning on %s", fan_switch.entity_id)
+            await fan_switch.async_turn_on()
+        elif is_fan_required is False and fan_switch.is_active:
+            _LOGGER.debug("Fan is not needed, turning off %s", fan_switch.entity_id)
+            await fan_switch.async_turn_off()
+
+        return HANDLED_RESULT if requested_action == HVACAction.FAN else EMPTY_RESULT
 
     async def _async_handle_action_climate(self, requested_action: HVACAction) -> UpdateResult:
-        result: UpdateResult = UpdateResult()
-
-        # Heating scenario, will either handle or defer
-        if requested_action == HVACAction.HEATING:
-            _LOGGER.debug("Handling request for heating action for climate system")
-
-            if self._cooler_switch.is_active is True:
-                # Cooler is on and should be shut off
-                if self._climate_cycle_manager.can_stop is True:
-                    _LOGGER.debug(
-                        "Heating requested while cooler is on, turning off %s",
-                        self._cooler_switch.entity_id,
-                    )
-                    await self._cooler_switch.async_turn_off()
-                    self._climate_cycle_manager.cycle_ended()
-                else:
-                    _LOGGER.debug("Heating requested while cooler in on but can't be stopped, deferring")
-                    self._defer_update(self._climate_cycle_manager.remaining_stop_time)
-                    result.is_deferred = True
-
-            if self._heater_switch.is_active is False:
-                # Heater is off and should be turned on
-                if self._climate_cycle_manager.can_start is True:
-                    _LOGGER.debug(
-                        "Heating requested, turning on %s",
-                        self._heater_switch.entity_id,
-                    )
-                    await self._heater_switch.async_turn_on()
-                    self._climate_cycle_manager.cycle_started()
-                    result.is_handled = True
-                else:
-                    _LOGGER.debug("Heating requested but can't be stopped, deferring")
-                    self._defer_update(self._climate_cycle_manager.remaining_start_time)
-                    result.is_deferred = True
+        is_handled: bool = False
+        cycle_manager: CycleManager = self._climate_cycle_manager
+        cycle_status: CycleStatus = cycle_manager.status()
+
+        # Anything other than heating/cooling only needs the climate switches stopped
+        switches_to_stop, switch_to_start = self._climate_transitions.get(
+            requested_action, self._climate_transitions[HVACAction.IDLE]
+        )
+        active_switches = [switch for switch in switches_to_stop if switch.is_active]
+
+        _LOGGER.debug("Handling request for %s action for climate system", requested_action)
+
+        if len(active_switches) > 0:
+            # Off is a special scenario, switches are turned off without checking if we can
+            if requested_action == HVACAction.OFF or cycle_status.can_stop:
+                for switch in active_switches:
+                    _LOGGER.debug("%s requested while %s is on, turning it off", requested_action, switch.entity_id)
+                    await switch.async_turn_off()
+
+                cycle_manager.cycle_ended()
+                self._cached_extra_state_attributes = None
+                cycle_status = cycle_manager.status()
+
+                # This may need to be set only when going from an active state to idle
+                is_handled = switch_to_start is None and requested_action != HVACAction.OFF
             else:
-                _LOGGER.warning("Heating requested and is already on, this is unexpected")
-                self._climate_cycle_manager.cycle_started()
-                result.is_handled = True
-
-        # Cooling scenario, will either handle or defer
-        elif requested_action == HVACAction.COOLING:
-            if self._heater_switch.is_active is True:
-                # Heater is on and should be shut off
-                if self._climate_cycle_manager.can_stop is True:
-                    _LOGGER.debug(
-                        "Cooling requested while heater is on, turning off %s",
-                        self._heater_switch.entity_id,
-                    )
-                    await self._heater_switch.async_turn_off()
-                    self._climate_cycle_manager.cycle_ended()
-                else:
-                    _LOGGER.debug("Cooling requested while haeter in on but can't be stopped, deferring")
-                    self._defer_update(self._climate_cycle_manager.remaining_stop_time)
-                    result.is_deferred = True
-
-            if self._cooler_switch.is_active is False:
-                # Cooler is off and should be turned on
-                if self._climate_cycle_manager.can_start is True:
-                    _LOGGER.debug(
-                        "Cooling requested, turning on %s",
-                        self._cooler_switch.entity_id,
-                    )
-                    await self._cooler_switch.async_turn_on()
-                    self._climate_cycle_manager.cycle_started()
-                    result.is_handled = True
-                else:
-                    _LOGGER.debug("Cooling requested but can't be stopped, deferring")
-                    self._defer_update(self._climate_cycle_manager.remaining_start_time)
-                    result.is_deferred = True
+                _LOGGER.debug("%s requested while the climate system is on but can't be stopped, deferring", requested_action)
+                self._defer_update(cycle_status.remaining_stop_time)
+                return DEFERRED_RESULT
+
+        if switch_to_start is not None:
+            if switch_to_start.is_active:
+                _LOGGER.warning("%s requested and %s is already on, this is unexpected", requested_action, switch_to_start.entity_id)
+                cycle_manager.cycle_started()
+                self._cached_extra_state_attributes = None
+                return HANDLED_RESULT
+            elif cycle_status.can_start:
+                _LOGGER.debug("%s requested, turning on %s", requested_action, switch_to_start.entity_id)
+                await switch_to_start.async_turn_on()
+                cycle_manager.cycle_started()
+                self._cached_extra_state_attributes = None
+                return HANDLED_RESULT
             else:
-                _LOGGER.warning("Cooling requested and is already on, this is unexpected")
-                self._climate_cycle_manager.cycle_started()
-                result.is_handled = True
-
-        # Special scenario, turn off without checking if we can, will either handle quietly or defer
-        elif requested_action == HVACAction.OFF:
-            if self._heater_switch.is_active is True or self._cooler_switch.is_active is True:
-                if self._heater_switch.is_active is True:
-                    _LOGGER.debug(
-                        "Off requested while heater is on, turning off %s",
-                        self._heater_switch.entity_id,
-                    )
-                    await self._heater_switch.async_turn_off()
-
-                if self._cooler_switch.is_active is True:
-                    _LOGGER.debug(
-                        "Off requested while cooler is on, turning off %s",
-                        self._cooler_switch.entity_id,
-                    )
-                    await self._cooler_switch.async_turn_off()
-
-                self._climate_cycle_manager.cycle_ended()
-
-        # Other cases, idle or not heat/cool, will either handle quietly or defer
-        else:
-            if self._heater_switch.is_active is True or self._cooler_switch.is_active is True:
-                if self._climate_cycle_manager.can_stop is True:
-                    if self._heater_switch.is_active is True:
-                        _LOGGER.debug(
-                            "Heater is on but not needed, turning off %s",
-                            self._heater_switch.entity_id,
-                        )
-                        await self._heater_switch.async_turn_off()
-
-                    if self._cooler_switch.is_active is True:
-                        _LOGGER.debug(
-                            "Cooler is on but not needed, turning off %s",
-                            self._cooler_switch.entity_id,
-                        )
-                        await self._cooler_switch.async_turn_off()
-
-                    self._climate_cycle_manager.cycle_ended()
-                    result.is_handled = True  # This may need to be set only when going from an active state to idle
-                else:
-                    _LOGGER.debug("Cooling requested while heater is on but can't be stopped, deferring")
-                    self._defer_update(self._climate_cycle_manager.remaining_stop_time)
-                    result.is_deferred = True
-
-        return result
+                _LOGGER.debug("%s requested but a cycle can't be started, deferring", requested_action)
+                self._defer_update(cycle_status.remaining_start_time)
+                return DEFERRED_RESULT
+
+        return HANDLED_RESULT if is_handled else EMPTY_RESULT
 
     def _defer_update(self, duration: timedelta) -> None:
-        if duration.total_seconds() < 1:
-            _LOGGER.debug(
-                "Requested duration was < 1 second (%s), defaulting to 1 second",
-                duration.total_seconds(),
-            )
-            duration = timedelta(seconds=1)
+        # Nothing to wait for, run the update right away. The update itself cancels any pending deferral
+        # so no listener is tracked here
+        if duration.total_seconds() <= 0:
+            _LOGGER.debug("Requested duration has already elapsed, updating immediately")
+            self.hass.async_create_task(self._async_update())
+            return
 
         if self._remove_pending_defferal_listener is None:
             _LOGGER.debug("Deferring update for %s second(s)", duration.total_seconds())
-            point_in_time: datetime = datetime.now(timezone.utc) + duration
-            self._remove_pending_defferal_listener = async_track_point_in_utc_time(
-                self.hass, self._async_deferred_update, point_in_time
-            )
+            self._remove_pending_defferal_listener = async_call_later(self.hass, duration, self._deferred_update_job)
         else:
             _LOGGER.debug("Deferral requested but one is pending, taking no action")
 
-    async def _async_deferred_update(self, _: datetime):
+    async def _async_debounced_update(self, _: datetime):
+        self._remove_pending_debounce_listener = None
         await self._async_update()
 
-    def _cleanup(self) -> None:
-        # Cleanup any pending deferrals
+    def _cancel_pending_deferral(self) -> None:
         if self._remove_pending_defferal_listener is not None:
             self._remove_pending_defferal_listener()
+            self._remove_pending_defferal_listener = None
+
+    def _cleanup(self) -> None:
+        # Cleanup any pending deferrals
+        self._cancel_pending_deferral()
+
+        if self._remove_pending_debounce_listener is not None:
+            self._remove_pending_debounce_listener()
+            self._remove_pending_debounce_listener = None
 
         self._opening_manager.destroy()
 
-    def _read_manual_settings(self, state: State) -> ClimateSettings:
+    def _read_manual_settings(self, state: State) -> ClimateSettings | None:
         """Read the manually set values from the state into a ClimateSettings object."""
-        target_temperature: float | None = state.attributes.get(ATTR_MANUAL_TARGET_TEMPERATURE)
-        target_temperature_low: float | None = state.attributes.get(ATTR_MANUAL_TARGET_TEMPERATURE_LOW)
-        target_temperature_high: float | None = state.attributes.get(ATTR_MANUAL_TARGET_TEMPERATURE_HIGH)
-        hvac_mode: HVACMode = state.attributes.get(ATTR_MANUAL_HVAC_MODE, self._default_hvac_mode)
-        fan_mode: FanMode = state.attributes.get(ATTR_MANUAL_FAN_MODE, self._default_fan_mode)
-
-        return (
-            ClimateSettings(
-                target_temperature_low,
-                target_temperature_high,
-                target_temperature,
-                hvac_mode,
-                fan_mode,
-            )
-            if (target_temperature_low is not None and target_temperature_high is not None) or target_temperature
-            else None
+        attributes_get = state.attributes.get
+        target_temperature: float | None = attributes_get(ATTR_MANUAL_TARGET_TEMPERATURE)
+        target_temperature_low: float | None = attributes_get(ATTR_MANUAL_TARGET_TEMPERATURE_LOW)
+        target_temperature_high: float | None = attributes_get(ATTR_MANUAL_TARGET_TEMPERATURE_HIGH)
+        has_range: bool = target_temperature_low is not None and target_temperature_high is not None
+
+        if not has_range and target_temperature is None:
+            return None
+
+        # The setters update settings in place and can leave a target alongside a range, which the validating
+        # constructor rejects, so restore has to accept whatever combination the setters produced
+        return ClimateSettings.unchecked(
+            target_temperature_low,
+            target_temperature_high,
+            target_temperature,
+            attributes_get(ATTR_MANUAL_HVAC_MODE, self._default_hvac_mode),
+            attributes_get(ATTR_MANUAL_FAN_MODE, self._default_fan_mode),
         )
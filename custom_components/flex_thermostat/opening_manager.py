@@ -1,11 +1,13 @@
 """Opening Manager Class."""
 
+import asyncio
 from collections.abc import Callable
-from datetime import datetime, timedelta, timezone
-from homeassistant.core import HomeAssistant, State, Event, CALLBACK_TYPE
+from datetime import datetime, timedelta
+from functools import partial
+from homeassistant.core import HomeAssistant, State, Event, CALLBACK_TYPE, HassJob
 from homeassistant.helpers.event import (
     async_track_state_change_event,
-    async_track_point_in_utc_time,
+    async_call_later,
 )
 from homeassistant.const import (
     STATE_ON,
@@ -14,31 +16,53 @@ from homeassistant.const import (
 
 from .const import _LOGGER
 
+# Opening entity states that are treated as open
+_OPEN_STATES: frozenset[str] = frozenset((STATE_ON, STATE_OPEN))
+
 
 class Opening:
     """Opening class used for tracking information about an opening entity."""
 
+    __slots__ = (
+        "entity_id",
+        "delay",
+        "is_open",
+        "pending_is_open",
+        "remove_pending_delay_listener",
+        "update_job",
+    )
+
     entity_id: str
     delay: timedelta
     is_open: bool
+    pending_is_open: bool
     remove_pending_delay_listener: CALLBACK_TYPE | None
+    update_job: HassJob | None
 
     def __init__(self, entity_id: str, delay: timedelta):
         """Initialize a new instance of the Opening class."""
 
         self.delay = delay
         self.entity_id = entity_id
+        self.is_open = False
+        self.pending_is_open = False
+        self.remove_pending_delay_listener = None
+        self.update_job = None
 
 
 class OpeningManager:
     """Manager for tracking the state of any openings such as doors or windows."""
 
+    is_any_opening_open: bool = False
+    """A flag indicating if any openings are open."""
+
     _is_initialized: bool = False
-    _is_any_opening_open: bool
+    _open_count: int = 0
     _openings: dict[str, Opening]
     _hass: HomeAssistant | None
     _remove_state_change_listener: CALLBACK_TYPE | None = None
     _on_change_callback: Callable[[bool], None] | None = None
+    _is_async_callback: bool = False
 
     def __init__(
         self,
@@ -46,12 +70,10 @@ class OpeningManager:
         default_delay: timedelta,
     ):
         """Initialize a new instance of the OpeningManager class."""
-        self._openings = dict[str, Opening]()
-
         # Setup the opening dictionary from the config tuples
-        for opening_config in opening_configs:
-            entity_id, delay = opening_config
-            self._openings[entity_id] = Opening(entity_id, delay or default_delay)
+        self._openings = {
+            entity_id: Opening(entity_id, delay or default_delay) for entity_id, delay in opening_configs or ()
+        }
 
     def initialize(self, hass: HomeAssistant, on_change_callback: Callable[[bool], None]) -> None:
         """Initialize the manage."""
@@ -61,15 +83,27 @@ class OpeningManager:
 
         self._hass = hass
         self._on_change_callback = on_change_callback
-        opening_entity_ids: list[str] = list[str]()
+        self._is_async_callback = asyncio.iscoroutinefunction(on_change_callback)
+        opening_entity_ids: list[str] = list(self._openings)
+
+        states_get = hass.states.get
+        is_opening_open = self._is_opening_open
+        async_update_opening = self._async_update_opening
+        open_count: int = 0
 
         # Set the initial opening states
         for opening in self._openings.values():
-            opening.is_open = self._is_opening_open(opening)
-            opening_entity_ids.append(opening.entity_id)
+            opening.is_open = is_opening_open(states_get(opening.entity_id))
+            if opening.is_open:
+                open_count += 1
+
+            opening.update_job = HassJob(
+                partial(async_update_opening, opening), f"flex_thermostat_opening_{opening.entity_id}"
+            )
 
         # Set the initial state
-        self._is_any_opening_open = any(o.is_open for o in self._openings.values())
+        self._open_count = open_count
+        self.is_any_opening_open = self._open_count > 0
 
         # If there are any openings, add a state change listener for them
         if len(opening_entity_ids) > 0:
@@ -92,41 +126,57 @@ class OpeningManager:
             # If the opening has a pending delay, remove the listener
             if opening.remove_pending_delay_listener is not None:
                 opening.remove_pending_delay_listener()
-
-    @property
-    def is_any_opening_open(self) -> bool:
-        """A flag indicating if any openings are open."""
-        return self._is_any_opening_open
+                opening.remove_pending_delay_listener = None
 
     async def _async_on_opening_entity_changed(self, event: Event) -> None:
-        entity_id: str = event.data.get("entity_id")
-        opening: Opening = self._openings.get(entity_id)
+        entity_id: str = event.data["entity_id"]
+        opening: Opening | None = self._openings.get(entity_id)
+        if opening is None:
+            return
 
-        _LOGGER.debug("Opening %s state changed, beginning delay", opening.entity_id)
+        # Keep the result from the event's state, any later change restarts the delay so it's still current when it elapses
+        is_open = self._is_opening_open(event.data["new_state"])
+
+        # Skip changes that don't change where the opening will end up, such as attribute only updates
+        expected_is_open = opening.pending_is_open if opening.remove_pending_delay_listener is not None else opening.is_open
+        if is_open == expected_is_open:
+            return
+
+        opening.pending_is_open = is_open
 
         # Remove any existing listener
         if opening.remove_pending_delay_listener is not None:
             _LOGGER.debug("An existing delay listener exists, removing it")
             opening.remove_pending_delay_listener()
+            opening.remove_pending_delay_listener = None
 
-        point_in_time: datetime = datetime.now(timezone.utc) + opening.delay
+            # The opening went back to its committed state before the delay elapsed so there's nothing left to update
+            if is_open == opening.is_open:
+                return
 
-        async def async_update_action() -> None:
-            await self._async_update_opening(opening)
+        _LOGGER.debug("Opening %s state changed, beginning delay", opening.entity_id)
 
-        opening.remove_pending_delay_listener = async_track_point_in_utc_time(self._hass, async_update_action, point_in_time)
+        opening.remove_pending_delay_listener = async_call_later(self._hass, opening.delay, opening.update_job)
 
-    async def _async_update_opening(self, opening: Opening) -> None:
+    async def _async_update_opening(self, opening: Opening, _: datetime | None = None) -> None:
         """Update the given opening and check if the overall state has changed."""
-        opening.is_open = self._is_opening_open(opening)
-        is_any_opening_open = any(o.is_open for o in self._openings.values())
+        opening.remove_pending_delay_listener = None
+        is_open = opening.pending_is_open
+        if is_open == opening.is_open:
+            return
+
+        # Track how many openings are open so only this opening needs to be checked
+        opening.is_open = is_open
+        self._open_count += 1 if is_open else -1
+        is_any_opening_open = self._open_count > 0
 
-        if self._is_any_opening_open != is_any_opening_open:
-            self._is_any_opening_open = is_any_opening_open
+        if self.is_any_opening_open != is_any_opening_open:
+            self.is_any_opening_open = is_any_opening_open
 
-            if self._on_change_callback is not None:
+            if self._is_async_callback:
                 await self._on_change_callback(is_any_opening_open)
+            elif self._on_change_callback is not None:
+                self._on_change_callback(is_any_opening_open)
 
-    def _is_opening_open(self, opening: Opening) -> bool:
-        opening_state: State | None = self._hass.states.get(opening.entity_id)
-        return opening_state in [STATE_OPEN, STATE_ON] if opening_state is not None else False
+    def _is_opening_open(self, opening_state: State | None) -> bool:
+        return opening_state is not None and opening_state.state in _OPEN_STATES
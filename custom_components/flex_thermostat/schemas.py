@@ -0,0 +1,102 @@
+"""Configuration schemas for the Flex Thermostat integration."""
+
+from __future__ import annotations
+import voluptuous as vol
+from homeassistant.helpers import config_validation as cv
+from homeassistant.components.climate import PLATFORM_SCHEMA as CLIMATE_PLATFORM_SCHEMA
+from homeassistant.components.climate.const import HVACMode
+
+from .utilities import FanMode
+from .const import (
+    CONF_NAME,
+    CONF_TEMP_SENSOR,
+    CONF_HEATER_SWITCH,
+    CONF_COOLER_SWITCH,
+    CONF_FAN_SWITCH,
+    CONF_TEMP_MIN,
+    CONF_TEMP_MAX,
+    CONF_TEMP_STEP,
+    CONF_TEMP_TOLERANCE,
+    CONF_CLIMATE_CYCLE_RUNTIME,
+    CONF_CLIMATE_CYCLE_COOLDOWN,
+    CONF_PRESETS,
+    CONF_PRESET_NAME,
+    CONF_CLIMATE_TARGET_TEMP,
+    CONF_CLIMATE_TARGET_TEMP_LOW,
+    CONF_CLIMATE_TARGET_TEMP_HIGH,
+    CONF_CLIMATE_FAN_MODE,
+    CONF_CLIMATE_HVAC_MODE,
+    CONF_OPENINGS,
+    CONF_OPENING_ENTITY,
+    CONF_OPENING_DELAY,
+    CONF_DEFAULT_OPENING_DELAY,
+    CONF_DEFAULT_PRESET_FAN_MODE,
+    CONF_DEFAULT_PRESET_HVAC_MODE,
+    CONF_INITIAL_PRESET,
+    CONF_INITIAL_SETTINGS,
+)
+
+SUPPORTED_FAN_MODES = (FanMode.ON, FanMode.OFF, FanMode.AUTO)
+SUPPORTED_HVAC_MODES = (
+    HVACMode.COOL,
+    HVACMode.HEAT,
+    HVACMode.OFF,
+    HVACMode.HEAT_COOL,
+    HVACMode.FAN_ONLY,
+)
+
+# Shared validators, built once and reused by every schema that needs them
+FAN_MODE_VALIDATOR = vol.In(SUPPORTED_FAN_MODES)
+HVAC_MODE_VALIDATOR = vol.In(SUPPORTED_HVAC_MODES)
+TIME_PERIOD_VALIDATOR = vol.All(cv.time_period, cv.positive_timedelta)
+
+CLIMATE_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_CLIMATE_TARGET_TEMP): vol.Coerce(float),
+        vol.Optional(CONF_CLIMATE_TARGET_TEMP_LOW): vol.Coerce(float),
+        vol.Optional(CONF_CLIMATE_TARGET_TEMP_HIGH): vol.Coerce(float),
+        vol.Optional(CONF_CLIMATE_FAN_MODE): FAN_MODE_VALIDATOR,
+        vol.Optional(CONF_CLIMATE_HVAC_MODE): HVAC_MODE_VALIDATOR,
+    }
+)
+
+OPENING_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_OPENING_ENTITY): cv.entity_id,
+        vol.Optional(CONF_OPENING_DELAY): TIME_PERIOD_VALIDATOR,
+    }
+)
+
+PRESET_SCHEMA = CLIMATE_SETTINGS_SCHEMA.extend({vol.Required(CONF_PRESET_NAME): cv.string})
+
+PLATFORM_SCHEMA = vol.All(
+    # Additional validations
+    cv.has_at_least_one_key(CONF_COOLER_SWITCH, CONF_HEATER_SWITCH, CONF_FAN_SWITCH),
+    CLIMATE_PLATFORM_SCHEMA.extend(
+        {
+            # Basic Config
+            vol.Required(CONF_NAME): cv.string,
+            vol.Required(CONF_TEMP_SENSOR): cv.entity_id,
+            vol.Optional(CONF_COOLER_SWITCH): cv.entity_id,
+            vol.Optional(CONF_HEATER_SWITCH): cv.entity_id,
+            vol.Optional(CONF_FAN_SWITCH): cv.entity_id,
+            # General Thermostat Settings
+            vol.Optional(CONF_TEMP_MIN): vol.Coerce(float),
+            vol.Optional(CONF_TEMP_MAX): vol.Coerce(float),
+            vol.Optional(CONF_TEMP_STEP): vol.Coerce(float),
+            vol.Optional(CONF_TEMP_TOLERANCE): vol.Coerce(float),
+            vol.Optional(CONF_CLIMATE_CYCLE_RUNTIME): TIME_PERIOD_VALIDATOR,
+            vol.Optional(CONF_CLIMATE_CYCLE_COOLDOWN): TIME_PERIOD_VALIDATOR,
+            # Presets/Openings
+            vol.Optional(CONF_PRESETS): vol.All(cv.ensure_list, [PRESET_SCHEMA]),
+            vol.Optional(CONF_OPENINGS): vol.All(cv.ensure_list, [OPENING_SCHEMA]),
+            # Configurable Defaults
+            vol.Optional(CONF_DEFAULT_OPENING_DELAY): TIME_PERIOD_VALIDATOR,
+            vol.Optional(CONF_DEFAULT_PRESET_FAN_MODE): FAN_MODE_VALIDATOR,
+            vol.Optional(CONF_DEFAULT_PRESET_HVAC_MODE): HVAC_MODE_VALIDATOR,
+            # Initial Settings
+            vol.Optional(CONF_INITIAL_PRESET): cv.string,
+            vol.Optional(CONF_INITIAL_SETTINGS): CLIMATE_SETTINGS_SCHEMA,
+        }
+    ),
+)
@@ -24,19 +24,37 @@ from .const import _LOGGER
 class SwitchManager:
     """Manager for controlling and tracking a switch entity."""
 
+    __slots__ = (
+        "_id",
+        "_is_active",
+        "_is_enabled",
+        "_hass",
+        "_is_initialized",
+        "_remove_state_change_listener",
+        "_on_change_callback",
+        "_is_async_callback",
+    )
+
     _id: str
     _is_active: bool
     _is_enabled: bool
     _hass: HomeAssistant | None
-    _is_initialized: bool = False
-    _remove_state_change_listener: CALLBACK_TYPE | None = None
-    _on_change_callback: Callable[[bool], None] | None = None
+    _is_initialized: bool
+    _remove_state_change_listener: CALLBACK_TYPE | None
+    _on_change_callback: Callable[[bool], None] | None
+    _is_async_callback: bool
 
     def __init__(self, entity_id: str):
         """Initialize a SwitchManager instance."""
 
         self._id = entity_id
         self._is_enabled = entity_id is not None
+        self._is_active = False
+        self._hass = None
+        self._is_initialized = False
+        self._remove_state_change_listener = None
+        self._on_change_callback = None
+        self._is_async_callback = False
 
     @property
     def entity_id(self) -> str:
@@ -46,8 +64,7 @@ class SwitchManager:
     @property
     def is_active(self) -> bool:
         """Gets a flag indicating if the switch is active (on)."""
-
-        if self._is_initialized is False:
+        if not self._is_initialized:
             raise RuntimeError("Switch has not been initialized")
 
         return self._is_enabled and self._is_active
@@ -67,6 +84,7 @@ class SwitchManager:
 
         self._hass = hass
         self._on_change_callback = on_change_callback
+        self._is_async_callback = asyncio.iscoroutinefunction(on_change_callback)
 
         if self._is_enabled is True:
             self._is_active = self._is_switch_on()
@@ -81,8 +99,7 @@ class SwitchManager:
 
     def destroy(self) -> None:
         """Cleanup manager resources."""
-
-        if self._is_initialized is False:
+        if not self._is_initialized:
             raise RuntimeError("Switch has not been initialized")
 
         self._hass = None
@@ -92,21 +109,33 @@ class SwitchManager:
 
     async def async_turn_on(self) -> None:
         """Turn the switch on."""
-        if self._is_initialized is False:
+        if not self._is_initialized:
             raise RuntimeError("Switch has not been initialized")
 
         if self._is_enabled is True and self._is_active is False:
-            self._is_active = False
-            await self._hass.services.async_call(HA_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: self._id})
+            # Optimistically track the new state, the state change listener will correct it if needed
+            self._is_active = True
+            try:
+                await self._hass.services.async_call(HA_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: self._id})
+            except Exception:
+                # The switch won't change so restore the previous state to allow retrying
+                self._is_active = False
+                raise
 
     async def async_turn_off(self) -> None:
         """Turn the switch off."""
-        if self._is_initialized is False:
+        if not self._is_initialized:
             raise RuntimeError("Switch has not been initialized")
 
         if self._is_enabled is True and self._is_active is True:
+            # Optimistically track the new state, the state change listener will correct it if needed
             self._is_active = False
-            await self._hass.services.async_call(HA_DOMAIN, SERVICE_TURN_OFF, {ATTR_ENTITY_ID: self._id})
+            try:
+                await self._hass.services.async_call(HA_DOMAIN, SERVICE_TURN_OFF, {ATTR_ENTITY_ID: self._id})
+            except Exception:
+                # The switch won't change so restore the previous state to allow retrying
+                self._is_active = True
+                raise
 
     async def _async_on_state_changed(self, event: Event) -> None:
         new_state = event.data.get("new_state")
@@ -119,7 +148,7 @@ class SwitchManager:
                 is_active,
             )
             self._is_active = is_active
-            if asyncio.iscoroutinefunction(self._on_change_callback):
+            if self._is_async_callback:
                 await self._on_change_callback(self._is_active)
             else:
                 self._on_change_callback(self._is_active)
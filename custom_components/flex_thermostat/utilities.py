@@ -1,41 +1,59 @@
 """Utility classes for the Flex Thermostat integration."""
 from __future__ import annotations
-from homeassistant.backports.enum import StrEnum
+from dataclasses import dataclass
+from typing import Final
 from homeassistant.components.climate.const import HVACMode
 
 
-class FanMode(StrEnum):
-    """Fan Mode for Climate Devices."""
+class FanMode:
+    """Fan Mode for Climate Devices, plain strings to match Home Assistant's climate constants."""
 
-    OFF = "off"
-    ON = "on"
-    AUTO = "auto"
+    OFF: Final[str] = "off"
+    ON: Final[str] = "on"
+    AUTO: Final[str] = "auto"
 
 
+@dataclass(frozen=True, slots=True)
 class UpdateResult:
     """Update result class."""
 
     is_handled: bool = False
     is_deferred: bool = False
 
-    def __add__(self, other: UpdateResult) -> UpdateResult:
-        """Add two UpdateResults together."""
+    def combine(self, other: UpdateResult) -> UpdateResult:
+        """Combine two UpdateResults, a result is handled or deferred if either of them is."""
+        if self is EMPTY_RESULT:
+            return other
+        elif other is EMPTY_RESULT:
+            return self
 
-        result: UpdateResult = UpdateResult()
-        result.is_handled = self.is_handled or other.is_handled
-        result.is_deferred = self.is_deferred or other.is_deferred
+        return UpdateResult(self.is_handled or other.is_handled, self.is_deferred or other.is_deferred)
 
-        return result
+    __or__ = combine
+
+
+# Shared results so handlers don't need to allocate one per update
+EMPTY_RESULT = UpdateResult()
+HANDLED_RESULT = UpdateResult(is_handled=True)
+DEFERRED_RESULT = UpdateResult(is_deferred=True)
 
 
 class ClimateSettings:
     """Class to store current and preset thermostat settings."""
 
+    __slots__ = (
+        "target_temperature_high",
+        "target_temperature_low",
+        "target_temperature",
+        "hvac_mode",
+        "fan_mode",
+    )
+
     target_temperature_high: float | None
     target_temperature_low: float | None
     target_temperature: float | None
     hvac_mode: HVACMode
-    fan_mode: FanMode
+    fan_mode: str | None
 
     def __init__(
         self,
@@ -43,27 +61,18 @@ class ClimateSettings:
         target_temperature_high: float | None,
         target_temperature: float | None,
         hvac_mode: HVACMode,
-        fan_mode: FanMode | None,
+        fan_mode: str | None,
     ) -> None:
         """Initialize an instance of the thermostat preset."""
-        if (
-            target_temperature is None
-            and target_temperature_high is None
-            and target_temperature_low is None
-        ):
+        has_target = target_temperature is not None
+        has_range = target_temperature_low is not None or target_temperature_high is not None
+
+        if not has_target and not has_range:
             raise RuntimeError("A target temperature or range must be specified")
-        if (target_temperature_low is not None and target_temperature_high is None) or (
-            target_temperature_low is None and target_temperature_high is not None
-        ):
-            raise RuntimeError(
-                "When defining a temperature range both high and low values must be specified"
-            )
-        elif target_temperature is not None and (
-            target_temperature_high is not None or target_temperature_low is not None
-        ):
-            raise RuntimeError(
-                "When defining a temperature target only the target can be defined"
-            )
+        if (target_temperature_low is None) != (target_temperature_high is None):
+            raise RuntimeError("When defining a temperature range both high and low values must be specified")
+        if has_target and has_range:
+            raise RuntimeError("When defining a temperature target only the target can be defined")
 
         self.target_temperature_low = target_temperature_low
         self.target_temperature_high = target_temperature_high
@@ -71,9 +80,28 @@ class ClimateSettings:
         self.hvac_mode = hvac_mode
         self.fan_mode = fan_mode
 
+    @classmethod
+    def unchecked(
+        cls,
+        target_temperature_low: float | None,
+        target_temperature_high: float | None,
+        target_temperature: float | None,
+        hvac_mode: HVACMode,
+        fan_mode: str | None,
+    ) -> ClimateSettings:
+        """Create settings without validation, only for values that come from already validated settings."""
+        settings: ClimateSettings = object.__new__(cls)
+        settings.target_temperature_low = target_temperature_low
+        settings.target_temperature_high = target_temperature_high
+        settings.target_temperature = target_temperature
+        settings.hvac_mode = hvac_mode
+        settings.fan_mode = fan_mode
+
+        return settings
+
     def clone(self) -> ClimateSettings:
-        """Create a clone of the settings."""
-        return ClimateSettings(
+        """Create a clone of the settings, skips validation since these settings are already valid."""
+        return ClimateSettings.unchecked(
             self.target_temperature_low,
             self.target_temperature_high,
             self.target_temperature,
@@ -0,0 +1,132 @@
+"""Tests for the Flex Thermostat platform setup."""
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.const import UnitOfTemperature
+import pytest
+import voluptuous as vol
+from custom_components.flex_thermostat.climate import _proccess_climate_settings, async_setup_platform
+from custom_components.flex_thermostat.const import (
+    CONF_NAME,
+    CONF_TEMP_SENSOR,
+    CONF_HEATER_SWITCH,
+    CONF_OPENINGS,
+    CONF_OPENING_ENTITY,
+    CONF_OPENING_DELAY,
+    CONF_DEFAULT_OPENING_DELAY,
+    CONF_TEMP_TOLERANCE,
+    CONF_CLIMATE_HVAC_MODE,
+    CONF_CLIMATE_TARGET_TEMP,
+    CONF_CLIMATE_TARGET_TEMP_LOW,
+    CONF_CLIMATE_TARGET_TEMP_HIGH,
+)
+
+
+@pytest.mark.parametrize(
+    ("settings_config", "message"),
+    [
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.HEAT_COOL, CONF_CLIMATE_TARGET_TEMP_HIGH: 24},
+            "A lower bound for the target temperature range is required for preset",
+        ),
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.HEAT_COOL, CONF_CLIMATE_TARGET_TEMP_LOW: 18},
+            "An upper bound for the target temperature range is required for preset",
+        ),
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.HEAT, CONF_CLIMATE_TARGET_TEMP_LOW: 18, CONF_CLIMATE_TARGET_TEMP_HIGH: 24},
+            "A target temperature range cannot be used for preset",
+        ),
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.COOL},
+            "Target temperature required for preset",
+        ),
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.OFF, CONF_CLIMATE_TARGET_TEMP_LOW: 18},
+            "A target temperature range cannot be used for preset",
+        ),
+        (
+            {CONF_CLIMATE_HVAC_MODE: HVACMode.FAN_ONLY, CONF_CLIMATE_TARGET_TEMP_HIGH: 24},
+            "A target temperature range cannot be used for preset",
+        ),
+    ],
+)
+def test_process_climate_settings_rejects_invalid_temperatures(settings_config, message):
+    """Test that invalid temperatures for a mode raise the expected error."""
+    # Act/Assert
+    with pytest.raises(vol.Invalid) as error:
+        _proccess_climate_settings(settings_config, "preset", None, None)
+
+    assert str(error.value) == message
+
+
+def test_process_climate_settings_requires_hvac_mode():
+    """Test that settings without a mode or fallback mode are rejected."""
+    # Act/Assert
+    with pytest.raises(vol.Invalid) as error:
+        _proccess_climate_settings({CONF_CLIMATE_TARGET_TEMP: 21}, "preset", None, None)
+
+    assert str(error.value) == "A HVACMode is required for preset"
+
+
+def test_process_climate_settings_accepts_range_for_heat_cool():
+    """Test that a range is accepted for the heat/cool mode."""
+    # Act
+    result = _proccess_climate_settings(
+        {CONF_CLIMATE_HVAC_MODE: HVACMode.HEAT_COOL, CONF_CLIMATE_TARGET_TEMP_LOW: 18, CONF_CLIMATE_TARGET_TEMP_HIGH: 24},
+        "preset",
+        None,
+        None,
+    )
+
+    # Assert
+    assert result.target_temperature_low == 18
+    assert result.target_temperature_high == 24
+    assert result.target_temperature is None
+
+
+def _setup_thermostat(**config):
+    """Run the platform setup with the given extra config and return the created thermostat."""
+    hass = SimpleNamespace(config=SimpleNamespace(units=SimpleNamespace(temperature_unit=UnitOfTemperature.CELSIUS)))
+    entities = []
+
+    asyncio.run(
+        async_setup_platform(
+            hass,
+            {CONF_NAME: "test", CONF_TEMP_SENSOR: "sensor.temperature", CONF_HEATER_SWITCH: "switch.heater", **config},
+            lambda new_entities, update_before_add: entities.extend(new_entities),
+        )
+    )
+
+    return entities[0]
+
+
+def test_setup_uses_default_opening_delay_only_for_openings_without_one():
+    """Test that every opening without its own delay gets the configured default delay."""
+    # Act
+    result = _setup_thermostat(
+        **{
+            CONF_DEFAULT_OPENING_DELAY: timedelta(seconds=45),
+            CONF_OPENINGS: [
+                {CONF_OPENING_ENTITY: "binary_sensor.first"},
+                {CONF_OPENING_ENTITY: "binary_sensor.second", CONF_OPENING_DELAY: timedelta(seconds=10)},
+                {CONF_OPENING_ENTITY: "binary_sensor.third"},
+            ],
+        }
+    )
+
+    # Assert
+    openings = result._opening_manager._openings
+    assert openings["binary_sensor.first"].delay == timedelta(seconds=45)
+    assert openings["binary_sensor.second"].delay == timedelta(seconds=10)
+    assert openings["binary_sensor.third"].delay == timedelta(seconds=45)
+
+
+def test_setup_reads_temperature_tolerance():
+    """Test that the temperature tolerance is read from the temp_tolerance key."""
+    # Act
+    result = _setup_thermostat(**{CONF_TEMP_TOLERANCE: 1.5})
+
+    # Assert
+    assert result._temperature_tolerance == 1.5
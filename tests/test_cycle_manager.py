@@ -0,0 +1,131 @@
+"""Tests for the Flex Thermostat cycle manager."""
+from datetime import datetime, timedelta, timezone
+import time
+import pytest
+from custom_components.flex_thermostat.cycle_manager import CycleManager
+
+
+def test_status_throws_error_when_uninitialized():
+    """Test that status raises an error before the manager is initialized."""
+    # Arrange
+    sut = CycleManager(timedelta(minutes=5), timedelta(minutes=5))
+
+    # Act/Assert
+    with pytest.raises(RuntimeError):
+        sut.status()
+
+
+def test_status_allows_start_and_stop_without_history():
+    """Test that a manager without any previous cycles can start and stop."""
+    # Arrange
+    sut = CycleManager(timedelta(minutes=5), timedelta(minutes=5))
+    sut.initialize(None, None)
+
+    # Act
+    result = sut.status()
+
+    # Assert
+    assert result.can_start
+    assert result.can_stop
+    assert result.remaining_start_time is None
+    assert result.remaining_stop_time is None
+
+
+def test_status_uses_given_timestamp():
+    """Test that status evaluates the deadlines against the given timestamp."""
+    # Arrange
+    now = datetime.now(timezone.utc)
+    sut = CycleManager(timedelta(minutes=10), timedelta(minutes=5))
+    sut.initialize(now - timedelta(minutes=2), now - timedelta(minutes=1))
+
+    # Act
+    result = sut.status(time.monotonic())
+
+    # Assert
+    assert not result.can_start
+    assert not result.can_stop
+    assert result.remaining_start_time.total_seconds() == pytest.approx(240, abs=1)
+    assert result.remaining_stop_time.total_seconds() == pytest.approx(480, abs=1)
+
+
+def test_status_allows_start_after_cooldown():
+    """Test that a restored stop older than the cooldown allows a new start."""
+    # Arrange
+    sut = CycleManager(None, timedelta(minutes=5))
+    sut.initialize(None, datetime.now(timezone.utc) - timedelta(minutes=10))
+
+    # Act
+    result = sut.status()
+
+    # Assert
+    assert result.can_start
+    assert result.remaining_start_time < timedelta(0)
+
+
+def test_cycle_ended_blocks_start_until_cooldown():
+    """Test that ending a cycle blocks a new start until the cooldown has passed."""
+    # Arrange
+    sut = CycleManager(None, timedelta(minutes=5))
+    sut.initialize(None, None)
+
+    # Act
+    sut.cycle_ended()
+
+    # Assert
+    assert not sut.can_start
+    assert sut.remaining_start_time > timedelta(minutes=4)
+
+
+def test_cycle_started_updates_last_start_iso():
+    """Test that starting a cycle caches the ISO formatted start time."""
+    # Arrange
+    sut = CycleManager(None, None)
+    sut.initialize(None, None)
+
+    # Act
+    sut.cycle_started()
+
+    # Assert
+    assert sut.last_start_iso == sut.last_start.isoformat()
+    assert sut.last_stop_iso is None
+
+
+def test_properties_match_status():
+    """Test that the start/stop properties report the same values as status."""
+    # Arrange
+    now = datetime.now(timezone.utc)
+    sut = CycleManager(timedelta(minutes=10), timedelta(minutes=5))
+    sut.initialize(now - timedelta(minutes=2), now - timedelta(minutes=1))
+
+    # Act
+    result = sut.status()
+
+    # Assert
+    assert sut.can_start == result.can_start
+    assert sut.can_stop == result.can_stop
+    assert sut.remaining_start_time.total_seconds() == pytest.approx(result.remaining_start_time.total_seconds(), abs=1)
+    assert sut.remaining_stop_time.total_seconds() == pytest.approx(result.remaining_stop_time.total_seconds(), abs=1)
+
+
+def test_remaining_times_are_none_without_history():
+    """Test that the remaining times are None, like status, when no cycle has run."""
+    # Arrange
+    sut = CycleManager(timedelta(minutes=10), timedelta(minutes=5))
+    sut.initialize(None, None)
+
+    # Act/Assert
+    assert sut.remaining_start_time is None
+    assert sut.remaining_stop_time is None
+
+
+def test_properties_throw_error_when_uninitialized():
+    """Test that the start/stop properties raise an error before the manager is initialized."""
+    # Arrange
+    sut = CycleManager(timedelta(minutes=5), timedelta(minutes=5))
+
+    # Act/Assert
+    with pytest.raises(RuntimeError):
+        sut.can_start
+
+    with pytest.raises(RuntimeError):
+        sut.remaining_stop_time
@@ -0,0 +1,636 @@
+"""Tests for the Flex Thermostat entity."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from homeassistant.components.climate.const import HVACAction, HVACMode
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfTemperature,
+)
+from homeassistant.core import Event, State
+import pytest
+from custom_components.flex_thermostat import flex_thermostat, switch_manager
+from custom_components.flex_thermostat.const import ATTR_CLIMATE_CYCLE_LAST_STOP
+from custom_components.flex_thermostat.flex_thermostat import FlexThermostat
+from custom_components.flex_thermostat.utilities import (
+    FanMode,
+    ClimateSettings,
+    EMPTY_RESULT,
+    HANDLED_RESULT,
+    DEFERRED_RESULT,
+)
+
+SENSOR_ID = "sensor.temperature"
+HEATER_ID = "switch.heater"
+COOLER_ID = "switch.cooler"
+FAN_ID = "switch.fan"
+
+
+class FakeHass:
+    """Minimal hass object that records service calls, created tasks, delayed calls and state writes."""
+
+    def __init__(self, *states: State):
+        """Initialize a new instance of the FakeHass class."""
+        self.states = SimpleNamespace(get={state.entity_id: state for state in states}.get)
+        self.services = SimpleNamespace(async_call=self._async_call)
+        self.service_calls = []
+        self.tasks = []
+        self.pending = []
+        self.cancelled = []
+        self.writes = []
+
+    async def _async_call(self, domain, service, data):
+        self.service_calls.append((service, data[ATTR_ENTITY_ID]))
+
+    def async_create_task(self, coroutine):
+        """Record the coroutine so the test can decide when to run it."""
+        self.tasks.append(coroutine)
+
+    def async_call_later(self, delay, action):
+        """Record the delayed call and return its canceller."""
+        entry = (delay, action)
+        self.pending.append(entry)
+
+        def cancel():
+            self.pending.remove(entry)
+            self.cancelled.append(entry)
+
+        return cancel
+
+    def fire_pending(self):
+        """Run every pending delayed call as if its delay had elapsed."""
+        pending, self.pending = self.pending, []
+        for _, action in pending:
+            target = getattr(action, "target", action)
+            asyncio.run(target(None))
+
+    def run_tasks(self):
+        """Run every created task."""
+        tasks, self.tasks = self.tasks, []
+        for task in tasks:
+            asyncio.run(task)
+
+
+@pytest.fixture(autouse=True)
+def event_helpers(monkeypatch):
+    """Replace the event helpers used by the thermostat and its switches with ones backed by FakeHass."""
+    monkeypatch.setattr(
+        flex_thermostat, "async_call_later", lambda hass, delay, action: hass.async_call_later(delay, action)
+    )
+    monkeypatch.setattr(switch_manager, "async_track_state_change_event", lambda hass, entity_id, action: None)
+
+
+def _create_thermostat(
+    heater_switch_id: str | None = None,
+    cooler_switch_id: str | None = None,
+    fan_switch_id: str | None = None,
+    climate_cycle_runtime: timedelta | None = None,
+    climate_cycle_cooldown: timedelta | None = None,
+    initial_settings: ClimateSettings | None = None,
+) -> FlexThermostat:
+    """Create a thermostat with the given switches and default settings."""
+    return FlexThermostat(
+        "test",
+        SENSOR_ID,
+        heater_switch_id,
+        cooler_switch_id,
+        fan_switch_id,
+        climate_cycle_runtime,
+        climate_cycle_cooldown,
+        [],
+        timedelta(seconds=30),
+        {},
+        HVACMode.OFF,
+        FanMode.OFF,
+        7,
+        35,
+        0.5,
+        UnitOfTemperature.CELSIUS,
+        1.0,
+        None,
+        initial_settings,
+    )
+
+
+def _start_thermostat(
+    sut: FlexThermostat,
+    temperature: str,
+    *switch_states: State,
+    last_start: datetime | None = None,
+    last_stop: datetime | None = None,
+) -> FakeHass:
+    """Initialize the thermostat the same way startup does, using a FakeHass with the given states."""
+    hass = FakeHass(State(SENSOR_ID, temperature), *switch_states)
+    sut.hass = hass
+    sut.async_write_ha_state = lambda: hass.writes.append(dict(sut.extra_state_attributes))
+
+    sut._read_temperature(hass.states.get(SENSOR_ID))
+    sut._heater_switch.initialize(hass, sut._on_switch_changed)
+    sut._cooler_switch.initialize(hass, sut._on_switch_changed)
+    sut._fan_switch.initialize(hass, sut._on_switch_changed)
+    sut._opening_manager.initialize(hass, sut._on_openings_state_changed)
+    sut._climate_cycle_manager.initialize(last_start, last_stop)
+    sut._is_initialized = True
+
+    return hass
+
+
+def test_available_modes_are_not_shared_between_instances():
+    """Test that each thermostat only reports the modes for its own switches."""
+    # Arrange
+    heater_thermostat = _create_thermostat(heater_switch_id=HEATER_ID, fan_switch_id=FAN_ID)
+
+    # Act
+    cooler_thermostat = _create_thermostat(cooler_switch_id=COOLER_ID)
+
+    # Assert
+    assert heater_thermostat.hvac_modes == (HVACMode.OFF, HVACMode.FAN_ONLY, HVACMode.HEAT)
+    assert heater_thermostat.fan_modes == (FanMode.OFF, FanMode.ON, FanMode.AUTO)
+    assert cooler_thermostat.hvac_modes == (HVACMode.OFF, HVACMode.COOL)
+    assert cooler_thermostat.fan_modes == ()
+
+
+def test_read_temperature_parses_new_state():
+    """Test that a numeric sensor state updates the current temperature."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID)
+
+    # Act
+    result = sut._read_temperature(State(SENSOR_ID, "21.5"))
+
+    # Assert
+    assert result
+    assert sut.current_temperature == 21.5
+
+
+def test_read_temperature_skips_repeated_state():
+    """Test that a sensor state identical to the last one isn't reported as new."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID)
+    sut._read_temperature(State(SENSOR_ID, "21.5"))
+
+    # Act
+    result = sut._read_temperature(State(SENSOR_ID, "21.5"))
+
+    # Assert
+    assert not result
+    assert sut.current_temperature == 21.5
+
+
+@pytest.mark.parametrize("state", [STATE_UNAVAILABLE, STATE_UNKNOWN, "not a number"])
+def test_read_temperature_keeps_last_temperature_for_unusable_state(state):
+    """Test that unavailable, unknown and unparseable states keep the last temperature."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID)
+    sut._read_temperature(State(SENSOR_ID, "21.5"))
+
+    # Act
+    result = sut._read_temperature(State(SENSOR_ID, state))
+
+    # Assert
+    assert not result
+    assert sut.current_temperature == 21.5
+
+
+def test_read_temperature_ignores_missing_state():
+    """Test that a removed sensor keeps the last temperature."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID)
+    sut._read_temperature(State(SENSOR_ID, "21.5"))
+
+    # Act
+    result = sut._read_temperature(None)
+
+    # Assert
+    assert not result
+    assert sut.current_temperature == 21.5
+
+
+def test_stop_with_deferred_start_writes_cycle_stop():
+    """Test that stopping the cooler while the heater start is deferred still writes the cycle stop."""
+    # Arrange
+    sut = _create_thermostat(
+        heater_switch_id=HEATER_ID,
+        cooler_switch_id=COOLER_ID,
+        climate_cycle_cooldown=timedelta(minutes=5),
+        initial_settings=ClimateSettings(18, 24, None, HVACMode.HEAT_COOL, None),
+    )
+    hass = _start_thermostat(sut, "25", State(HEATER_ID, STATE_OFF), State(COOLER_ID, STATE_ON))
+    sut._current_action = HVACAction.COOLING
+    sut._write_state()
+    hass.writes.clear()
+    sut._read_temperature(State(SENSOR_ID, "16"))
+    sut._write_state()
+    hass.writes.clear()
+
+    # Act
+    asyncio.run(sut._async_update())
+
+    # Assert
+    assert hass.service_calls == [(SERVICE_TURN_OFF, COOLER_ID)]
+    assert sut.hvac_action == HVACAction.COOLING
+    assert len(hass.pending) == 1
+    assert len(hass.writes) == 1
+    assert hass.writes[0][ATTR_CLIMATE_CYCLE_LAST_STOP] is not None
+
+
+def _create_heating_thermostat(**kwargs) -> FlexThermostat:
+    """Create a heat only thermostat targeting 21 degrees."""
+    return _create_thermostat(
+        heater_switch_id=HEATER_ID,
+        initial_settings=ClimateSettings(None, None, 21, HVACMode.HEAT, None),
+        **kwargs,
+    )
+
+
+def test_update_without_changes_does_nothing():
+    """Test that an update with the same action and state makes no service calls and no state write."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+    hass.writes.clear()
+
+    # Act
+    asyncio.run(sut._async_update())
+
+    # Assert
+    assert hass.service_calls == []
+    assert hass.writes == []
+
+
+def test_update_with_new_action_writes_state():
+    """Test that an update that changes the action turns on the switch and writes the state."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+    sut._read_temperature(State(SENSOR_ID, "19"))
+    hass.writes.clear()
+
+    # Act
+    asyncio.run(sut._async_update())
+
+    # Assert
+    assert hass.service_calls == [(SERVICE_TURN_ON, HEATER_ID)]
+    assert sut.hvac_action == HVACAction.HEATING
+    assert len(hass.writes) == 1
+
+
+def test_update_with_new_cycle_timestamp_writes_state():
+    """Test that an update with the same action still writes the state when a cycle timestamp changed."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+    sut._climate_cycle_manager.cycle_ended()
+    sut._cached_extra_state_attributes = None
+    hass.writes.clear()
+
+    # Act
+    asyncio.run(sut._async_update())
+
+    # Assert
+    assert hass.service_calls == []
+    assert len(hass.writes) == 1
+    assert hass.writes[0][ATTR_CLIMATE_CYCLE_LAST_STOP] == sut._climate_cycle_manager.last_stop_iso
+
+
+@pytest.mark.parametrize("hvac_mode", [HVACMode.HEAT, HVACMode.COOL, HVACMode.HEAT_COOL])
+def test_startup_with_unavailable_sensor_idles(hvac_mode):
+    """Test that starting with an unavailable sensor and then changing the mode idles instead of failing."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID, cooler_switch_id=COOLER_ID)
+    hass = _start_thermostat(sut, STATE_UNAVAILABLE, State(HEATER_ID, STATE_OFF), State(COOLER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+
+    # Act
+    asyncio.run(sut.async_set_hvac_mode(hvac_mode))
+
+    # Assert
+    assert sut.current_temperature is None
+    assert sut._get_hvac_action() == HVACAction.IDLE
+    assert hass.service_calls == []
+
+
+@pytest.mark.parametrize(
+    ("action", "heater_state", "cooler_state", "expected_calls", "expected_result"),
+    [
+        (HVACAction.HEATING, STATE_OFF, STATE_OFF, [(SERVICE_TURN_ON, HEATER_ID)], HANDLED_RESULT),
+        (
+            HVACAction.HEATING,
+            STATE_OFF,
+            STATE_ON,
+            [(SERVICE_TURN_OFF, COOLER_ID), (SERVICE_TURN_ON, HEATER_ID)],
+            HANDLED_RESULT,
+        ),
+        (HVACAction.HEATING, STATE_ON, STATE_OFF, [], HANDLED_RESULT),
+        (HVACAction.COOLING, STATE_OFF, STATE_OFF, [(SERVICE_TURN_ON, COOLER_ID)], HANDLED_RESULT),
+        (
+            HVACAction.COOLING,
+            STATE_ON,
+            STATE_OFF,
+            [(SERVICE_TURN_OFF, HEATER_ID), (SERVICE_TURN_ON, COOLER_ID)],
+            HANDLED_RESULT,
+        ),
+        (HVACAction.IDLE, STATE_ON, STATE_OFF, [(SERVICE_TURN_OFF, HEATER_ID)], HANDLED_RESULT),
+        (HVACAction.IDLE, STATE_OFF, STATE_OFF, [], EMPTY_RESULT),
+        (
+            HVACAction.OFF,
+            STATE_ON,
+            STATE_ON,
+            [(SERVICE_TURN_OFF, HEATER_ID), (SERVICE_TURN_OFF, COOLER_ID)],
+            EMPTY_RESULT,
+        ),
+        (HVACAction.FAN, STATE_OFF, STATE_ON, [(SERVICE_TURN_OFF, COOLER_ID)], HANDLED_RESULT),
+    ],
+)
+def test_handle_action_climate_switches(action, heater_state, cooler_state, expected_calls, expected_result):
+    """Test that each action stops and starts the expected climate switches."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID, cooler_switch_id=COOLER_ID)
+    hass = _start_thermostat(sut, "21", State(HEATER_ID, heater_state), State(COOLER_ID, cooler_state))
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_climate(action))
+
+    # Assert
+    assert hass.service_calls == expected_calls
+    assert result == expected_result
+    assert hass.pending == []
+
+
+def test_handle_action_climate_defers_stop_within_runtime():
+    """Test that stopping a switch before the minimum runtime defers the update for the remaining runtime."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID, climate_cycle_runtime=timedelta(minutes=10))
+    hass = _start_thermostat(
+        sut,
+        "21",
+        State(HEATER_ID, STATE_ON),
+        last_start=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_climate(HVACAction.IDLE))
+
+    # Assert
+    assert result == DEFERRED_RESULT
+    assert hass.service_calls == []
+    assert [delay.total_seconds() for delay, _ in hass.pending] == [pytest.approx(540, abs=1)]
+
+
+def test_handle_action_climate_deferred_stop_does_not_start_other_switch():
+    """Test that a deferred stop returns before trying to start the requested switch."""
+    # Arrange
+    sut = _create_thermostat(
+        heater_switch_id=HEATER_ID, cooler_switch_id=COOLER_ID, climate_cycle_runtime=timedelta(minutes=10)
+    )
+    hass = _start_thermostat(
+        sut,
+        "21",
+        State(HEATER_ID, STATE_OFF),
+        State(COOLER_ID, STATE_ON),
+        last_start=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_climate(HVACAction.HEATING))
+
+    # Assert
+    assert result == DEFERRED_RESULT
+    assert hass.service_calls == []
+    assert len(hass.pending) == 1
+
+
+def test_handle_action_climate_off_ignores_runtime():
+    """Test that the off action stops the switches even before the minimum runtime."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID, climate_cycle_runtime=timedelta(minutes=10))
+    hass = _start_thermostat(
+        sut,
+        "21",
+        State(HEATER_ID, STATE_ON),
+        last_start=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_climate(HVACAction.OFF))
+
+    # Assert
+    assert result == EMPTY_RESULT
+    assert hass.service_calls == [(SERVICE_TURN_OFF, HEATER_ID)]
+    assert hass.pending == []
+
+
+def test_handle_action_climate_defers_start_within_cooldown():
+    """Test that starting a switch before the cooldown has passed defers the update for the remaining cooldown."""
+    # Arrange
+    sut = _create_thermostat(heater_switch_id=HEATER_ID, climate_cycle_cooldown=timedelta(minutes=5))
+    hass = _start_thermostat(
+        sut,
+        "21",
+        State(HEATER_ID, STATE_OFF),
+        last_stop=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_climate(HVACAction.HEATING))
+
+    # Assert
+    assert result == DEFERRED_RESULT
+    assert hass.service_calls == []
+    assert [delay.total_seconds() for delay, _ in hass.pending] == [pytest.approx(240, abs=1)]
+
+
+def test_apply_action_keeps_current_action_when_deferred():
+    """Test that a deferred action isn't tracked as the current action and leaves the fan alone."""
+    # Arrange
+    sut = _create_thermostat(
+        heater_switch_id=HEATER_ID,
+        fan_switch_id=FAN_ID,
+        climate_cycle_cooldown=timedelta(minutes=5),
+        initial_settings=ClimateSettings(None, None, 21, HVACMode.HEAT, FanMode.AUTO),
+    )
+    hass = _start_thermostat(
+        sut,
+        "21",
+        State(HEATER_ID, STATE_OFF),
+        State(FAN_ID, STATE_OFF),
+        last_stop=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    asyncio.run(sut._async_apply_action(HVACAction.HEATING))
+
+    # Assert
+    assert sut.hvac_action == HVACAction.IDLE
+    assert hass.service_calls == []
+
+
+@pytest.mark.parametrize(
+    ("action", "fan_mode", "fan_state", "expected_calls"),
+    [
+        (HVACAction.HEATING, FanMode.AUTO, STATE_OFF, [(SERVICE_TURN_ON, FAN_ID)]),
+        (HVACAction.HEATING, FanMode.AUTO, STATE_ON, []),
+        (HVACAction.COOLING, FanMode.AUTO, STATE_OFF, [(SERVICE_TURN_ON, FAN_ID)]),
+        (HVACAction.IDLE, FanMode.AUTO, STATE_OFF, []),
+        (HVACAction.IDLE, FanMode.AUTO, STATE_ON, [(SERVICE_TURN_OFF, FAN_ID)]),
+        (HVACAction.HEATING, FanMode.ON, STATE_OFF, [(SERVICE_TURN_ON, FAN_ID)]),
+        (HVACAction.IDLE, FanMode.ON, STATE_OFF, [(SERVICE_TURN_ON, FAN_ID)]),
+        (HVACAction.IDLE, FanMode.ON, STATE_ON, []),
+        (HVACAction.HEATING, FanMode.OFF, STATE_ON, [(SERVICE_TURN_OFF, FAN_ID)]),
+        (HVACAction.IDLE, FanMode.OFF, STATE_ON, [(SERVICE_TURN_OFF, FAN_ID)]),
+        (HVACAction.IDLE, FanMode.OFF, STATE_OFF, []),
+        (HVACAction.OFF, FanMode.ON, STATE_ON, [(SERVICE_TURN_OFF, FAN_ID)]),
+        (HVACAction.OFF, FanMode.AUTO, STATE_OFF, []),
+        (HVACAction.FAN, FanMode.OFF, STATE_OFF, [(SERVICE_TURN_ON, FAN_ID)]),
+        (HVACAction.FAN, FanMode.AUTO, STATE_ON, []),
+    ],
+)
+def test_handle_action_fan_switches(action, fan_mode, fan_state, expected_calls):
+    """Test that the fan follows the action for off/fan only and the fan mode otherwise."""
+    # Arrange
+    sut = _create_thermostat(
+        fan_switch_id=FAN_ID,
+        initial_settings=ClimateSettings(None, None, 21, HVACMode.HEAT, fan_mode),
+    )
+    hass = _start_thermostat(sut, "21", State(FAN_ID, fan_state))
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_fan(action))
+
+    # Assert
+    assert hass.service_calls == expected_calls
+    assert result == (HANDLED_RESULT if action == HVACAction.FAN else EMPTY_RESULT)
+
+
+def test_handle_action_fan_without_fan_switch_does_nothing():
+    """Test that the fan handler does nothing when no fan switch is configured."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "21", State(HEATER_ID, STATE_OFF))
+
+    # Act
+    result = asyncio.run(sut._async_handle_action_fan(HVACAction.FAN))
+
+    # Assert
+    assert result == EMPTY_RESULT
+    assert hass.service_calls == []
+
+
+def _temperature_event(temperature: str) -> Event:
+    """Create a temperature sensor state change event."""
+    return Event("state_changed", {"entity_id": SENSOR_ID, "new_state": State(SENSOR_ID, temperature)})
+
+
+def _count_updates(sut: FlexThermostat) -> list:
+    """Wrap the thermostat's update so each call is recorded, returns the list of calls."""
+    calls = []
+    async_update = sut._async_update
+
+    async def counting_update(*args):
+        calls.append(args)
+        await async_update(*args)
+
+    sut._async_update = counting_update
+    return calls
+
+
+def test_temperature_burst_triggers_one_update():
+    """Test that repeated sensor events within the debounce window result in a single update."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+    updates = _count_updates(sut)
+
+    # Act
+    for temperature in ("20", "19.5", "19"):
+        sut._on_temperature_changed(_temperature_event(temperature))
+
+    # Assert
+    assert [delay for delay, _ in hass.pending] == [sut._TEMPERATURE_DEBOUNCE_SECONDS]
+    assert len(hass.cancelled) == 2
+    assert updates == []
+
+    hass.fire_pending()
+
+    assert len(updates) == 1
+    assert sut._remove_pending_debounce_listener is None
+    assert hass.service_calls == [(SERVICE_TURN_ON, HEATER_ID)]
+
+
+def test_temperature_change_without_new_action_only_writes_state():
+    """Test that a sensor event that doesn't change the action writes the state without scheduling an update."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    asyncio.run(sut._async_update())
+    hass.writes.clear()
+
+    # Act
+    sut._on_temperature_changed(_temperature_event("22.5"))
+
+    # Assert
+    assert hass.pending == []
+    assert len(hass.writes) == 1
+    assert sut.current_temperature == 22.5
+
+
+def test_update_cancels_pending_deferral():
+    """Test that running an update cancels a pending deferral."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    sut._defer_update(timedelta(seconds=30))
+
+    # Act
+    asyncio.run(sut._async_update())
+
+    # Assert
+    assert hass.pending == []
+    assert len(hass.cancelled) == 1
+    assert sut._remove_pending_defferal_listener is None
+
+
+def test_defer_update_keeps_pending_deferral():
+    """Test that a deferral requested while one is pending doesn't schedule another."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "22", State(HEATER_ID, STATE_OFF))
+    sut._defer_update(timedelta(seconds=30))
+
+    # Act
+    sut._defer_update(timedelta(seconds=10))
+
+    # Assert
+    assert [delay for delay, _ in hass.pending] == [timedelta(seconds=30)]
+    assert hass.cancelled == []
+
+
+@pytest.mark.parametrize("duration", [timedelta(0), timedelta(seconds=-5)])
+def test_defer_update_with_elapsed_duration_updates_immediately(duration):
+    """Test that a deferral with no time left creates an update task instead of scheduling a delay."""
+    # Arrange
+    sut = _create_heating_thermostat()
+    hass = _start_thermostat(sut, "19", State(HEATER_ID, STATE_OFF))
+    updates = _count_updates(sut)
+
+    # Act
+    sut._defer_update(duration)
+
+    # Assert
+    assert hass.pending == []
+    assert sut._remove_pending_defferal_listener is None
+
+    hass.run_tasks()
+
+    assert len(updates) == 1
+    assert hass.service_calls == [(SERVICE_TURN_ON, HEATER_ID)]
@@ -0,0 +1,257 @@
+"""Tests for the Flex Thermostat opening manager."""
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+import pytest
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import Event, State
+from custom_components.flex_thermostat import opening_manager
+from custom_components.flex_thermostat.opening_manager import OpeningManager
+
+ENTITY_ID = "binary_sensor.window"
+
+
+class FakeScheduler:
+    """Stand in for the Home Assistant event helpers that records listeners and pending delays."""
+
+    def __init__(self):
+        """Initialize a new instance of the FakeScheduler class."""
+        self.pending = []
+        self.cancelled = []
+        self.state_listener_removed = False
+
+    def async_track_state_change_event(self, hass, entity_ids, action):
+        """Record the state listener and return its remover."""
+        self.entity_ids = entity_ids
+
+        def remove():
+            self.state_listener_removed = True
+
+        return remove
+
+    def async_call_later(self, hass, delay, job):
+        """Record the delayed job and return its canceller."""
+        entry = (delay, job)
+        self.pending.append(entry)
+
+        def cancel():
+            self.pending.remove(entry)
+            self.cancelled.append(entry)
+
+        return cancel
+
+    def fire_pending(self):
+        """Run every pending delayed job as if its delay had elapsed."""
+        pending, self.pending = self.pending, []
+        for _, job in pending:
+            asyncio.run(job.target(None))
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """Replace the event helpers used by the opening manager with a FakeScheduler."""
+    fake = FakeScheduler()
+    monkeypatch.setattr(opening_manager, "async_track_state_change_event", fake.async_track_state_change_event)
+    monkeypatch.setattr(opening_manager, "async_call_later", fake.async_call_later)
+    return fake
+
+
+def _create_hass(*states: State):
+    """Create a minimal hass object that returns the given states."""
+    states_by_id = {state.entity_id: state for state in states}
+    return SimpleNamespace(states=SimpleNamespace(get=states_by_id.get))
+
+
+def _create_manager(*states: State, delay: timedelta = timedelta(seconds=30)):
+    """Create an initialized manager for a single opening, returning it with its received changes."""
+    received = []
+    sut = OpeningManager([(ENTITY_ID, delay)], timedelta(seconds=5))
+    sut.initialize(_create_hass(*states), received.append)
+    return sut, received
+
+
+def _change_state(sut: OpeningManager, state: str, attributes: dict | None = None, entity_id: str = ENTITY_ID):
+    """Send a state change event for an opening to the manager."""
+    event = Event("state_changed", {"entity_id": entity_id, "new_state": State(entity_id, state, attributes)})
+    asyncio.run(sut._async_on_opening_entity_changed(event))
+
+
+def test_initialize_reads_current_opening_state(scheduler):
+    """Test that an opening that is already open is reported as open."""
+    # Act
+    sut, received = _create_manager(State(ENTITY_ID, STATE_ON))
+
+    # Assert
+    assert sut.is_any_opening_open
+    assert scheduler.entity_ids == [ENTITY_ID]
+    assert received == []
+
+
+def test_opening_opens_after_delay(scheduler):
+    """Test that opening an opening only reports it as open once its delay elapses."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+
+    # Act
+    _change_state(sut, STATE_ON)
+
+    # Assert
+    assert not sut.is_any_opening_open
+    assert [delay for delay, _ in scheduler.pending] == [timedelta(seconds=30)]
+
+    scheduler.fire_pending()
+
+    assert sut.is_any_opening_open
+    assert received == [True]
+
+
+def test_opening_closes_after_delay(scheduler):
+    """Test that closing an open opening reports it as closed once its delay elapses."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_ON))
+
+    # Act
+    _change_state(sut, STATE_OFF)
+    scheduler.fire_pending()
+
+    # Assert
+    assert not sut.is_any_opening_open
+    assert received == [False]
+
+
+def test_opening_flapping_within_delay_cancels_pending_update(scheduler):
+    """Test that an opening that reverts before its delay elapses cancels the delay without rescheduling."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+    _change_state(sut, STATE_ON)
+
+    # Act
+    _change_state(sut, STATE_OFF)
+
+    # Assert
+    assert scheduler.pending == []
+    assert len(scheduler.cancelled) == 1
+    assert sut._openings[ENTITY_ID].remove_pending_delay_listener is None
+    assert not sut.is_any_opening_open
+    assert received == []
+
+
+def test_opening_flapping_after_revert_restarts_delay(scheduler):
+    """Test that an opening that opens again after reverting schedules a new delay."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+    _change_state(sut, STATE_ON)
+    _change_state(sut, STATE_OFF)
+
+    # Act
+    _change_state(sut, STATE_ON)
+    scheduler.fire_pending()
+
+    # Assert
+    assert sut.is_any_opening_open
+    assert received == [True]
+
+
+def test_attribute_only_change_does_not_schedule_delay(scheduler):
+    """Test that an event that only changes attributes doesn't schedule a delay."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+
+    # Act
+    _change_state(sut, STATE_OFF, {"battery": 50})
+
+    # Assert
+    assert scheduler.pending == []
+    assert received == []
+
+
+def test_attribute_only_change_keeps_pending_delay(scheduler):
+    """Test that an attribute only event while a delay is pending doesn't restart the delay."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+    _change_state(sut, STATE_ON)
+    pending = list(scheduler.pending)
+
+    # Act
+    _change_state(sut, STATE_ON, {"battery": 50})
+
+    # Assert
+    assert scheduler.pending == pending
+    assert scheduler.cancelled == []
+
+
+def test_unknown_entity_is_ignored(scheduler):
+    """Test that an event for an entity that isn't a tracked opening is ignored."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+
+    # Act
+    _change_state(sut, STATE_ON, entity_id="binary_sensor.unknown")
+
+    # Assert
+    assert scheduler.pending == []
+    assert not sut.is_any_opening_open
+
+
+def test_opening_uses_default_delay_when_none_configured():
+    """Test that an opening without its own delay uses the default delay."""
+    # Act
+    sut = OpeningManager([(ENTITY_ID, None)], timedelta(seconds=5))
+
+    # Assert
+    assert sut._openings[ENTITY_ID].delay == timedelta(seconds=5)
+
+
+def test_no_opening_configs_initializes_without_listener(scheduler):
+    """Test that a manager created without opening configs initializes with nothing open and no listener."""
+    # Arrange
+    sut = OpeningManager(None, timedelta(seconds=5))
+
+    # Act
+    sut.initialize(_create_hass(), lambda is_open: None)
+
+    # Assert
+    assert not sut.is_any_opening_open
+    assert sut._remove_state_change_listener is None
+    assert not hasattr(scheduler, "entity_ids")
+
+
+def test_new_opening_has_all_attributes_set():
+    """Test that a new opening has every tracked attribute set before any event is received."""
+    # Act
+    sut = OpeningManager([(ENTITY_ID, None)], timedelta(seconds=5))
+
+    # Assert
+    opening = sut._openings[ENTITY_ID]
+    assert not opening.is_open
+    assert not opening.pending_is_open
+    assert opening.remove_pending_delay_listener is None
+    assert opening.update_job is None
+
+
+def test_destroy_before_any_event(scheduler):
+    """Test that destroying the manager before any event removes the state listener."""
+    # Arrange
+    sut, _ = _create_manager(State(ENTITY_ID, STATE_OFF))
+
+    # Act
+    sut.destroy()
+
+    # Assert
+    assert scheduler.state_listener_removed
+    assert scheduler.cancelled == []
+
+
+def test_destroy_cancels_pending_delay(scheduler):
+    """Test that destroying the manager cancels any pending delay."""
+    # Arrange
+    sut, received = _create_manager(State(ENTITY_ID, STATE_OFF))
+    _change_state(sut, STATE_ON)
+
+    # Act
+    sut.destroy()
+
+    # Assert
+    assert scheduler.pending == []
+    assert sut._openings[ENTITY_ID].remove_pending_delay_listener is None
+    assert received == []
@@ -1,4 +1,10 @@
+import asyncio
+from types import SimpleNamespace
 import pytest
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import Event, State
+from homeassistant.exceptions import HomeAssistantError
+from custom_components.flex_thermostat import switch_manager
 from custom_components.flex_thermostat.switch_manager import SwitchManager
 
 
@@ -45,3 +51,80 @@ def test_is_enabled_false_when_entity_id_none():
 
     # Assert
     assert False == result
+
+
+def test_state_change_awaits_async_callback():
+    """Test that a state change awaits a coroutine change callback."""
+    # Arrange
+    received = []
+
+    async def on_change(is_active: bool) -> None:
+        received.append(is_active)
+
+    sut = SwitchManager(None)
+    sut.initialize(None, on_change)
+    event = Event("state_changed", {"new_state": State("switch.fake", STATE_ON)})
+
+    # Act
+    asyncio.run(sut._async_on_state_changed(event))
+
+    # Assert
+    assert received == [True]
+
+
+def test_state_change_calls_sync_callback():
+    """Test that a state change calls a plain change callback."""
+    # Arrange
+    received = []
+    sut = SwitchManager(None)
+    sut.initialize(None, received.append)
+    event = Event("state_changed", {"new_state": State("switch.fake", STATE_ON)})
+
+    # Act
+    asyncio.run(sut._async_on_state_changed(event))
+
+    # Assert
+    assert received == [True]
+
+
+def _create_failing_hass(state: str):
+    """Create a minimal hass object whose service calls always fail."""
+    calls = []
+
+    async def async_call(domain, service, data):
+        calls.append(service)
+        raise HomeAssistantError("Service call failed")
+
+    hass = SimpleNamespace(
+        states=SimpleNamespace(get=lambda entity_id: State(entity_id, state)),
+        services=SimpleNamespace(async_call=async_call),
+    )
+    return hass, calls
+
+
+@pytest.mark.parametrize(
+    ("state", "turn", "expected_is_active"),
+    [
+        (STATE_OFF, SwitchManager.async_turn_on, False),
+        (STATE_ON, SwitchManager.async_turn_off, True),
+    ],
+)
+def test_failed_service_call_restores_state(monkeypatch, state, turn, expected_is_active):
+    """Test that a failed service call restores the previous state so the change can be retried."""
+    # Arrange
+    monkeypatch.setattr(switch_manager, "async_track_state_change_event", lambda hass, entity_id, action: None)
+    hass, calls = _create_failing_hass(state)
+    sut = SwitchManager("switch.fake")
+    sut.initialize(hass, lambda is_active: None)
+
+    # Act
+    with pytest.raises(HomeAssistantError):
+        asyncio.run(turn(sut))
+
+    # Assert
+    assert sut.is_active == expected_is_active
+
+    with pytest.raises(HomeAssistantError):
+        asyncio.run(turn(sut))
+
+    assert len(calls) == 2
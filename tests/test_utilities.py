@@ -0,0 +1,57 @@
+"""Tests for the Flex Thermostat utility classes."""
+import dataclasses
+import pytest
+from custom_components.flex_thermostat.utilities import (
+    UpdateResult,
+    EMPTY_RESULT,
+    HANDLED_RESULT,
+    DEFERRED_RESULT,
+)
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "is_handled", "is_deferred"),
+    [
+        (UpdateResult(), UpdateResult(), False, False),
+        (UpdateResult(is_handled=True), UpdateResult(), True, False),
+        (UpdateResult(), UpdateResult(is_deferred=True), False, True),
+        (UpdateResult(is_handled=True), UpdateResult(is_deferred=True), True, True),
+        (UpdateResult(is_handled=True), UpdateResult(is_handled=True), True, False),
+    ],
+)
+def test_update_result_combine_merges_flags(first, second, is_handled, is_deferred):
+    """Test that a combined result is handled or deferred if either result is."""
+    # Act
+    result = first.combine(second)
+
+    # Assert
+    assert result.is_handled == is_handled
+    assert result.is_deferred == is_deferred
+
+
+def test_update_result_or_matches_combine():
+    """Test that the | operator combines results the same way as combine."""
+    # Act
+    result = HANDLED_RESULT | DEFERRED_RESULT
+
+    # Assert
+    assert result == HANDLED_RESULT.combine(DEFERRED_RESULT)
+    assert result == UpdateResult(is_handled=True, is_deferred=True)
+
+
+@pytest.mark.parametrize("other", [EMPTY_RESULT, HANDLED_RESULT, DEFERRED_RESULT])
+def test_update_result_combine_with_empty_returns_other_result(other):
+    """Test that combining with the empty result returns the other result without allocating a new one."""
+    # Act/Assert
+    assert EMPTY_RESULT.combine(other) is other
+    assert other.combine(EMPTY_RESULT) is other
+
+
+def test_update_result_is_immutable_and_not_a_tuple():
+    """Test that results can't be modified and no longer behave like tuples."""
+    # Act/Assert
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        HANDLED_RESULT.is_handled = False
+
+    assert not isinstance(HANDLED_RESULT, tuple)
+    assert not hasattr(HANDLED_RESULT, "__dict__")